@@ -6,7 +6,7 @@ import logging
 import tkinter as tk
 from pathlib import Path
 from tkinter import messagebox, ttk
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, Final, override
 
 import customtkinter as ctk
 
@@ -25,6 +25,15 @@ logger = logging.getLogger(__name__)
 class JSONEditComponent(AppComponent):
     """JSON Editor component for viewing and editing JSON metadata."""
 
+    # Delay after the last keystroke before the edited JSON is compared to the original
+    JSON_CHANGE_DEBOUNCE_MS: Final = 250
+
+    @override
+    def initialize_state(self) -> None:
+        self._json_change_job: str | None = None
+        # Serialized JSON of the loaded song, compared against the text widget to detect edits
+        self._original_json_text = ""
+
     @override
     def setup_ui(self) -> None:
         self.grid_columnconfigure(0, weight=1)
@@ -81,11 +90,14 @@ class JSONEditComponent(AppComponent):
 
     def update_json(self, metadata: "SongMetadata") -> None:
         """Update the JSON text area with metadata."""
+        self._cancel_json_change()
+        self._original_json_text = ""
         self.json_text.delete("1.0", "end")
         if metadata.raw_data:
             try:
                 # FIXED: Ensure proper encoding for JSON dump
                 json_str = json.dumps(metadata.raw_data, indent=2, ensure_ascii=False)
+                self._original_json_text = json_str
                 self.json_text.insert("1.0", json_str)
             except Exception:
                 logger.exception("Error displaying JSON with UTF-8 encoding")
@@ -101,21 +113,26 @@ class JSONEditComponent(AppComponent):
         self.json_save_btn.configure(state="disabled")
 
     def on_json_changed(self, _event: tk.Event | None = None) -> None:
+        """Schedule a save button update, collapsing a burst of keystrokes into one comparison."""
+        self._cancel_json_change()
+        self._json_change_job = self.after(self.JSON_CHANGE_DEBOUNCE_MS, self._update_save_button)
+
+    def _cancel_json_change(self) -> None:
+        if self._json_change_job is not None:
+            self.after_cancel(self._json_change_job)
+            self._json_change_job = None
+
+    def _update_save_button(self) -> None:
         """Enable/disable save button based on JSON changes."""
+        self._json_change_job = None
         if self.app.current_index is None:
             self.json_save_btn.configure(state="disabled")
             return
 
         current_text = self.json_text.get("1.0", "end-1c").strip()
 
-        # Get original JSON from metadata
-        original_json = ""
-        if self.app.current_metadata and self.app.current_metadata.raw_data:
-            with contextlib.suppress(Exception):
-                original_json = json.dumps(self.app.current_metadata.raw_data, indent=2, ensure_ascii=False)
-
         # Enable button only if text has changed and is not empty
-        if current_text and current_text != original_json:
+        if current_text and current_text != self._original_json_text:
             self.json_save_btn.configure(state="normal")
         else:
             self.json_save_btn.configure(state="disabled")
@@ -159,6 +176,9 @@ class JSONEditComponent(AppComponent):
                 # Update cache with new data
                 self.app.file_manager.update_file_data(path, json_data)
                 self.app.current_metadata = self.app.file_manager.get_metadata(path)
+                self._original_json_text = ""
+                with contextlib.suppress(Exception):
+                    self._original_json_text = json.dumps(json_data, indent=2, ensure_ascii=False)
 
                 # Update the treeview with new data
                 self.app.update_tree_row(self.app.current_index, json_data)
@@ -1,13 +1,14 @@
 """Output Preview Component."""
 
 import logging
-from typing import override
+from typing import Final, override
 
 import customtkinter as ctk
 
 from df_metadata_customizer.components.app_component import AppComponent
 from df_metadata_customizer.rule_manager import RuleManager
 from df_metadata_customizer.settings_manager import SettingsManager
+from df_metadata_customizer.song_metadata import MetadataFields
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,13 @@ logger = logging.getLogger(__name__)
 class OutputPreviewComponent(AppComponent):
     """Output Preview Component to see the output of metadata rules in real-time."""
 
+    # Delay (ms) after the last rule edit before the preview is recomputed
+    PREVIEW_DEBOUNCE_MS: Final = 80
+
+    @override
+    def initialize_state(self) -> None:
+        self._preview_job: str | None = None
+
     @override
     def setup_ui(self) -> None:
         self.grid_columnconfigure(1, weight=1)
@@ -79,8 +87,19 @@ class OutputPreviewComponent(AppComponent):
         except Exception:
             logger.exception("Error updating output preview style")
 
+    def request_preview(self, *_args: object) -> None:
+        """Schedule a preview update, collapsing a burst of rule edits into one evaluation."""
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(self.PREVIEW_DEBOUNCE_MS, self.update_preview)
+
     def update_preview(self) -> None:
         """Update the output preview based on current rules and selected JSON."""
+        # An immediate update supersedes any pending debounced one
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+            self._preview_job = None
+
         if not self.app.current_metadata:
             self.lbl_out_title.configure(text="")
             self.lbl_out_artist.configure(text="")
@@ -92,18 +111,21 @@ class OutputPreviewComponent(AppComponent):
 
         metadata = self.app.current_metadata
 
-        # Collect new values based on rules
+        # Collect new values based on rules; like Apply, fields no rule produces keep their current tag
         new_title = RuleManager.apply_rules_list(
             self.app.collect_rules_for_tab("title"),
             metadata,
+            default=metadata.get(MetadataFields.UI_ID3_TITLE),
         )
         new_artist = RuleManager.apply_rules_list(
             self.app.collect_rules_for_tab("artist"),
             metadata,
+            default=metadata.get(MetadataFields.UI_ID3_ARTIST),
         )
         new_album = RuleManager.apply_rules_list(
             self.app.collect_rules_for_tab("album"),
             metadata,
+            default=metadata.get(MetadataFields.UI_ID3_ALBUM),
         )
 
         # Display new values
@@ -17,6 +17,11 @@ class RuleTabsComponent(AppComponent):
     @override
     def initialize_state(self) -> None:
         self.rule_containers: dict[str, ctk.CTkFrame] = {}
+        # Rule rows per tab in visual order, kept in sync so callers don't have to query Tk for children
+        self.rule_rows: dict[str, list[RuleRow]] = {}
+        self._container_tabs: dict[ctk.CTkFrame, str] = {}
+        # Removed rule rows per tab, kept unpacked and reused so presets don't rebuild every widget
+        self._row_pool: dict[str, list[RuleRow]] = {}
 
     @override
     def setup_ui(self) -> None:
@@ -61,6 +66,9 @@ class RuleTabsComponent(AppComponent):
 
             self._setup_scroll_events(scroll)
             self.rule_containers[name.lower()] = scroll
+            self.rule_rows[name.lower()] = []
+            self._row_pool[name.lower()] = []
+            self._container_tabs[scroll] = name.lower()
 
     def _on_tab_changed(self) -> None:
         """Handle tab change events to update scroll bindings."""
@@ -75,7 +83,7 @@ class RuleTabsComponent(AppComponent):
         container = self.rule_containers.get(tab_name.lower())
         if container:
             # Count current rules in this tab
-            current_rules = len([w for w in container.winfo_children() if isinstance(w, RuleRow)])
+            current_rules = len(self.rule_rows[tab_name.lower()])
 
             # Check if we've reached the limit
             if current_rules >= self.app.max_rules_per_tab:
@@ -92,21 +100,10 @@ class RuleTabsComponent(AppComponent):
 
     def add_rule(self, container: ctk.CTkFrame) -> None:
         """Add a rule row to the specified container."""
-        # Count current rules to determine if this is the first one
-        current_rules = len([w for w in container.winfo_children() if isinstance(w, RuleRow)])
-        is_first = current_rules == 0
-
-        row = RuleRow(
-            container,
-            self.app.RULE_OPS,
-            move_callback=self.move_rule,
-            delete_callback=self.delete_rule,
-            is_first=is_first,
-        )
-        row.pack(fill="x", padx=6, pady=3)
+        parent_tab = self.container_to_tab(container)
+        row = self._acquire_row(parent_tab)
 
         # default template suggestions based on container tab
-        parent_tab = self.container_to_tab(container)
         if parent_tab == "title":
             row.template_entry.insert(0, f"{{{MetadataFields.COVER_ARTIST}}} - {{{MetadataFields.TITLE}}}")
         elif parent_tab == "artist":
@@ -114,31 +111,65 @@ class RuleTabsComponent(AppComponent):
         elif parent_tab == "album":
             row.template_entry.insert(0, f"Archive VOL {{{MetadataFields.DISC}}}")
 
-        # FIXED: Use force preview update for immediate response
-        def update_callback(*_args: tuple) -> None:
-            self.app.output_preview_component.update_preview()
-
-        row.field_var.trace("w", update_callback)
-        row.op_var.trace("w", update_callback)
-        row.logic_var.trace("w", update_callback)  # Add logic change listener
-        row.value_entry.bind("<KeyRelease>", lambda _e: self.app.output_preview_component.update_preview())
-        row.template_entry.bind("<KeyRelease>", lambda _e: self.app.output_preview_component.update_preview())
-
         # Update button states for all rules in this container
         self.update_rule_button_states(container)
 
         # Update button states after adding
         self.update_rule_tab_buttons()
-        # Initial update
-        self.app.output_preview_component.update_preview()
+        # Initial update (coalesced when a preset adds many rules at once)
+        self.app.output_preview_component.request_preview()
+
+    def add_preset_rule(self, tab_name: str, rule: dict[str, str]) -> None:
+        """Append a rule row filled from a saved rule dict (without tab-wide button updates)."""
+        row = self._acquire_row(tab_name)
+        row.field_var.set(rule.get("if_field", MetadataFields.get_json_keys()[0]))
+        row.op_var.set(rule.get("if_operator", self.app.RULE_OPS[0]))
+        row.value_entry.insert(0, rule.get("if_value", ""))
+        row.template_entry.insert(0, rule.get("then_template", ""))
+        # Set logic for non-first rules
+        if not row.is_first:
+            row.logic_var.set(rule.get("logic", "AND"))
+
+    def _acquire_row(self, tab_name: str) -> RuleRow:
+        """Pack a blank rule row at the end of a tab, reusing a removed row when one is available."""
+        rows = self.rule_rows[tab_name]
+        is_first = not rows
+        pool = self._row_pool[tab_name]
+
+        if pool:
+            row = pool.pop()
+            row.set_first(is_first=is_first)
+            row.reset()
+        else:
+            row = RuleRow(
+                self.rule_containers[tab_name],
+                self.app.RULE_OPS,
+                move_callback=self.move_rule,
+                delete_callback=self.delete_rule,
+                is_first=is_first,
+            )
+
+            # Debounced so typing into a rule re-evaluates the preview once per pause, not per keystroke
+            request_preview = self.app.output_preview_component.request_preview
+
+            row.field_var.trace("w", request_preview)
+            row.op_var.trace("w", request_preview)
+            row.logic_var.trace("w", request_preview)  # Add logic change listener
+            row.value_entry.bind("<KeyRelease>", request_preview)
+            row.template_entry.bind("<KeyRelease>", request_preview)
+
+        row.pack(fill="x", padx=6, pady=3)
+        rows.append(row)
+        return row
+
+    def _release_row(self, tab_name: str, row: RuleRow) -> None:
+        """Unpack a removed rule row and keep it for reuse."""
+        row.pack_forget()
+        self._row_pool[tab_name].append(row)
 
     def move_rule(self, widget: RuleRow, direction: int) -> None:
         """Move a rule up or down."""
-        container = widget.master
-
-        # Use pack_slaves to get the current visual order
-        slaves = container.pack_slaves()
-        children = [w for w in slaves if isinstance(w, RuleRow)]
+        children = self.rule_rows[self.container_to_tab(widget.master)]
 
         try:
             idx = children.index(widget)
@@ -166,26 +197,28 @@ class RuleTabsComponent(AppComponent):
     def delete_rule(self, widget: RuleRow) -> None:
         """Delete a rule from its container."""
         container = widget.master
-        children = [w for w in container.winfo_children() if isinstance(w, RuleRow)]
+        tab_name = self.container_to_tab(container)
+        children = self.rule_rows[tab_name]
 
         if widget not in children:
             return
 
         # Remove the widget
-        widget.destroy()
+        children.remove(widget)
+        self._release_row(tab_name, widget)
 
         # Update button states for remaining rules
         self.after(0, lambda: self.update_rule_button_states(container))
 
         # Update button states after deletion (rules are now below limit)
         self.update_rule_tab_buttons()
-        self.app.output_preview_component.update_preview()
+        self.app.output_preview_component.request_preview()
 
     def update_rule_tab_buttons(self) -> None:
         """Update the Add Rule buttons for each tab based on rule counts."""
         for tab_name, container in self.rule_containers.items():
             # Count current rules in this tab
-            current_rules = len([w for w in container.winfo_children() if isinstance(w, RuleRow)])
+            current_rules = len(self.rule_rows[tab_name])
 
             # Find the Add Rule button for this tab
             # We need to get to the header frame that contains the button
@@ -223,15 +256,26 @@ class RuleTabsComponent(AppComponent):
 
     def container_to_tab(self, container: ctk.CTkFrame) -> str:
         """Get tab name from container widget."""
-        for tab_name, cont in self.rule_containers.items():
-            if cont == container:
-                return tab_name
-        return "title"
+        return self._container_tabs.get(container, "title")
+
+    def begin_bulk_update(self, tab_name: str) -> None:
+        """Hide a tab's rule container so rows can be destroyed and packed without a relayout each."""
+        self.rule_containers[tab_name].grid_remove()
+
+    def end_bulk_update(self, tab_name: str) -> None:
+        """Show the container again after begin_bulk_update, laying it out once."""
+        self.rule_containers[tab_name].grid()
+
+    def clear_rules(self, tab_name: str) -> None:
+        """Remove all rule rows in a tab, keeping them for reuse."""
+        # Reversed, so rows are reused in their old order and keep their first/non-first logic widget
+        for row in reversed(self.rule_rows[tab_name]):
+            self._release_row(tab_name, row)
+        self.rule_rows[tab_name].clear()
 
     def update_rule_button_states(self, container: ctk.CTkFrame) -> None:
         """Update button states for rules in a container."""
-        slaves = container.pack_slaves()
-        children = [w for w in slaves if isinstance(w, RuleRow)]
+        children = self.rule_rows[self.container_to_tab(container)]
 
         for i, child in enumerate(children):
             child.set_first(is_first=i == 0)
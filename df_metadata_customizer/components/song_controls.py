@@ -1,7 +1,7 @@
 """Song Controls Component."""
 
 import tkinter as tk
-from typing import override
+from typing import Final, override
 
 import customtkinter as ctk
 
@@ -11,10 +11,14 @@ from df_metadata_customizer.components.app_component import AppComponent
 class SongControlsComponent(AppComponent):
     """Song controls component for folder selection, search, and select all."""
 
+    # Delay (ms) after the last keystroke before the song list is filtered
+    SEARCH_DEBOUNCE_MS: Final = 80
+
     @override
     def initialize_state(self) -> None:
         self.search_var = tk.StringVar()
         self.select_all_var = tk.BooleanVar(value=False)
+        self._search_after_id: str | None = None
 
     @override
     def setup_ui(self) -> None:
@@ -46,9 +50,10 @@ class SongControlsComponent(AppComponent):
 
     def on_search_keyrelease(self, _event: tk.Event | None = None) -> None:
         """Debounced search handler."""
-        if hasattr(self, "_search_after_id"):
+        if self._search_after_id is not None:
             self.after_cancel(self._search_after_id)
-        self._search_after_id = self.after_idle(self._trigger_refresh)
+        self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self._trigger_refresh)
 
     def _trigger_refresh(self) -> None:
+        self._search_after_id = None
         self.app.event_generate("<<TreeComponent:RefreshTree>>")
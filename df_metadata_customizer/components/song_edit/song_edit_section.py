@@ -2,7 +2,6 @@
 
 import logging
 import shutil
-from io import BytesIO
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import override
@@ -496,24 +495,11 @@ class SongEditComponent(AppComponent):
             if self.adding_new_song and final_dest_path:
                 shutil.copy2(self.new_song_source_path, final_dest_path)
 
-            # 2. metadata (JSON + ID3)
-
-            if target_path:
-                # Write JSON
-                song_utils.write_json_to_song(target_path, json_data)
-
-                # Write ID3 (Standard Tags)
-                song_utils.write_id3_tags(target_path, **id3_data)
-
-                # Update file manager cache
-                self.app.file_manager.update_file_data(target_path, json_data)
-
-            # 3. Cover Art
+            # 2. Cover Art
             # Only write cover if pending change exists or adding new song
+            cover_bytes = None
+            cover_mime = "image/jpeg"
             if self.pending_cover_path:
-                cover_bytes = None
-                cover_mime = "image/jpeg"
-
                 # If pending path is an image file
                 if self.pending_cover_path.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")):
                     cover_bytes = Path(self.pending_cover_path).read_bytes()
@@ -524,17 +510,17 @@ class SongEditComponent(AppComponent):
 
                 # If pending path is a song file (copy from another song)
                 elif self.pending_cover_path.lower().endswith(tuple(song_utils.SUPPORTED_FILES_TYPES)):
-                    # extract cover
-                    img = song_utils.read_cover_from_song(self.pending_cover_path)
-                    if img:
-                        # Convert PIL to bytes
-                        b = BytesIO()
-                        img.save(b, format="JPEG")
-                        cover_bytes = b.getvalue()
-                        # cover_mime stays jpeg
-
-                if cover_bytes and target_path:
-                    song_utils.write_id3_tags(target_path, cover_bytes=cover_bytes, cover_mime=cover_mime)
+                    # Copy the embedded picture as-is; decoding and re-encoding would only cost time and quality
+                    cover = song_utils.read_cover_bytes_from_song(self.pending_cover_path)
+                    if cover:
+                        cover_bytes, cover_mime = cover
+
+            # 3. metadata (JSON + ID3 + cover), written with a single tag load and save
+            if target_path:
+                song_utils.write_song_metadata(target_path, json_data, id3_data, cover_bytes, cover_mime)
+
+                # Update file manager cache
+                self.app.file_manager.update_file_data(target_path, json_data)
 
             # 4. Update song list and treeview
             if self.adding_new_song and target_path:
@@ -97,8 +97,8 @@ class SortingComponent(AppComponent):
         self.sort_rules.pop(idx)
         self.sort_rules.insert(new_idx, widget)
 
-        # Repack and update UI
-        self.repack_sort_rules()
+        # Move just this row in the pack order; the primary rule stays first, so no labels change
+        widget.pack_configure(after=self.sort_rules[new_idx - 1])
         self.update_sort_rule_buttons()
         self.app.refresh_tree()
 
@@ -113,35 +113,13 @@ class SortingComponent(AppComponent):
         if idx == 0:
             return
 
-        # Remove the widget
+        # Remove the widget; the remaining rows keep their pack order
         self.sort_rules.pop(idx)
         widget.destroy()
 
-        # Repack and refresh
-        self.repack_sort_rules()
         self.update_sort_rule_buttons()
         self.app.refresh_tree()
 
-    def repack_sort_rules(self) -> None:
-        """Repack all sort rules in current order."""
-        # Clear the container
-        for child in self.sort_container.winfo_children():
-            child.pack_forget()
-
-        # Repack in current order
-        for rule in self.sort_rules:
-            rule.pack(fill="x", padx=0, pady=2)
-        # Ensure is_first flag is kept in sync with position (only index 0 is primary)
-        for i, rule in enumerate(self.sort_rules):
-            rule.is_first = i == 0
-            try:
-                if rule.is_first:
-                    rule.sort_label.configure(text="Sort by:")
-                else:
-                    rule.sort_label.configure(text="then by:")
-            except Exception:
-                logger.exception("Error updating sort rule label")
-
     def update_sort_rule_buttons(self) -> None:
         """Update button visibility for sort rules."""
         for i, rule in enumerate(self.sort_rules):
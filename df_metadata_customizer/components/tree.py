@@ -6,10 +6,13 @@ import logging
 import os
 import platform
 import subprocess
+import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import messagebox, ttk
-from typing import override
+from typing import Final, override
+
+import polars as pl
 
 from df_metadata_customizer import song_utils
 from df_metadata_customizer.components.app_component import AppComponent
@@ -23,10 +26,56 @@ logger = logging.getLogger(__name__)
 class TreeComponent(AppComponent):
     """Tree view component for song list."""
 
+    # Rows inserted by populate_rows before the tree is shown; the rest are added while it is in use
+    FIRST_PAGE_ROWS: Final = 200
+
+    # Seconds of tree insertion per event loop turn while filling in rows (about one frame)
+    POPULATE_FRAME_BUDGET: Final = 0.016
+
+    # Whole-number versions at or beyond this magnitude don't fit Int64 and are shown as floats
+    INT64_LIMIT: Final = 2.0**63
+
+    DARK_STYLE: Final = {
+        "Treeview": {"background": "#2b2b2b", "foreground": "white", "fieldbackground": "#2b2b2b", "borderwidth": 0},
+        "Treeview.Heading": {"background": "#3b3b3b", "foreground": "white", "relief": "flat"},
+        "selected": "#1f6aa5",
+        "heading_active": "#4b4b4b",
+        "menu": {
+            "background": "#2b2b2b",
+            "foreground": "white",
+            "activebackground": "#1f6aa5",
+            "activeforeground": "white",
+        },
+    }
+    LIGHT_STYLE: Final = {
+        "Treeview": {"background": "white", "foreground": "black", "fieldbackground": "white", "borderwidth": 0},
+        "Treeview.Heading": {"background": "#f0f0f0", "foreground": "black", "relief": "flat"},
+        "selected": "#0078d7",
+        "heading_active": "#e0e0e0",
+        "menu": {
+            "background": "white",
+            "foreground": "black",
+            "activebackground": "#0078d7",
+            "activeforeground": "white",
+        },
+    }
+
     @override
     def initialize_state(self) -> None:
         self.dragged_column = None
         self.highlighted_column = None
+        self._applied_dark: bool | None = None  # Theme the tree style was last built for
+
+        # Values of every row item (attached or detached), keyed by iid
+        self.row_values: dict[str, tuple] = {}
+
+        # Rows populate_rows has yet to insert, in display order, and the after() job inserting them
+        self._pending_rows: list[tuple[str, tuple]] = []
+        self._fill_job: str | None = None
+        # Bumped whenever a fill is cancelled, so a batch callback that still fires knows it is stale
+        self._fill_generation = 0
+        # Pending rows are inserted last-first at this index, right after the first page (a short walk for ttk)
+        self._fill_index = 0
 
         self.column_order = [
             MetadataFields.UI_TITLE,
@@ -112,39 +161,23 @@ class TreeComponent(AppComponent):
     def update_theme(self) -> None:
         try:
             dark = SettingsManager.is_dark_mode()
+            # Restyling makes Tk redraw every row, so skip it when the effective theme did not change
+            if dark == self._applied_dark:
+                return
+
+            style = self.DARK_STYLE if dark else self.LIGHT_STYLE
 
             # Treeview
             self.style.theme_use("default")
-            self.style.configure(
-                "Treeview",
-                background="#2b2b2b" if dark else "white",
-                foreground="white" if dark else "black",
-                fieldbackground="#2b2b2b" if dark else "white",
-                borderwidth=0,
-            )
-            self.style.configure(
-                "Treeview.Heading",
-                background="#3b3b3b" if dark else "#f0f0f0",
-                foreground="white" if dark else "black",
-                relief="flat",
-            )
-            self.style.map(
-                "Treeview",
-                background=[("selected", "#1f6aa5" if dark else "#0078d7")],
-            )
-            self.style.map(
-                "Treeview.Heading",
-                background=[("active", "#4b4b4b" if dark else "#e0e0e0")],
-            )
+            self.style.configure("Treeview", **style["Treeview"])
+            self.style.configure("Treeview.Heading", **style["Treeview.Heading"])
+            self.style.map("Treeview", background=[("selected", style["selected"])])
+            self.style.map("Treeview.Heading", background=[("active", style["heading_active"])])
 
             # Context menu
-            self.context_menu.configure(
-                background="#2b2b2b" if dark else "white",
-                foreground="white" if dark else "black",
-                activebackground="#1f6aa5" if dark else "#0078d7",
-                activeforeground="white",
-            )
+            self.context_menu.configure(**style["menu"])
 
+            self._applied_dark = dark
         except Exception:
             logger.exception("Error updating treeview style")
 
@@ -317,6 +350,8 @@ class TreeComponent(AppComponent):
 
     def rebuild_tree_columns(self) -> None:
         """Rebuild tree columns with new order."""
+        # Pending values are in the old column order too
+        self.flush_rows()
         # Save current selection and scroll position
         selection = self.tree.selection()
         scroll_v = self.tree.yview()
@@ -374,7 +409,8 @@ class TreeComponent(AppComponent):
         try:
             # Build mapping from field name to index in previous values
             prev_index = {name: idx for idx, name in enumerate(prev_columns)}
-            for iid in self.tree.get_children():
+            # Include detached rows so they are correct when shown again
+            for iid in self.row_values:
                 vals = list(self.tree.item(iid, "values") or [])
                 # create dict of previous values
                 vals_map = {}
@@ -385,8 +421,9 @@ class TreeComponent(AppComponent):
                         vals_map[name] = ""
 
                 # Build new values tuple according to new_columns order
-                new_vals = [vals_map.get(name, "") for name in new_columns]
-                self.tree.item(iid, values=tuple(new_vals))
+                new_vals = tuple(vals_map.get(name, "") for name in new_columns)
+                self.tree.item(iid, values=new_vals)
+                self.row_values[iid] = new_vals
         except Exception:
             logger.exception("Error remapping tree item values")
 
@@ -400,15 +437,144 @@ class TreeComponent(AppComponent):
         except Exception:
             logger.exception("Error restoring scroll position")
 
-    def get_row_values(self, row: dict) -> tuple:
-        """Extract and format values for treeview columns from a data row."""
-        values = []
+    def get_rows(self, df: pl.DataFrame) -> list[tuple[str, tuple]]:
+        """Build (iid, values) pairs for every row of a view DataFrame in one vectorized pass.
+
+        Whole columns are formatted in Polars instead of looking up and converting each cell in Python.
+        """
+        if df.is_empty():
+            return []
+
+        exprs = [pl.col("orig_index").cast(pl.Utf8).alias("_iid")]
         for col in self.column_order:
             data_key = RuleManager.COL_MAP.get(col)
             if col == MetadataFields.UI_VERSION:
-                v = row.get(MetadataFields.VERSION, 0.0)
-                val = str(int(v)) if isinstance(v, float) and v.is_integer() else str(v)
+                if MetadataFields.VERSION in df.columns:
+                    v = pl.col(MetadataFields.VERSION).fill_null(0.0)
+                    # Both branches are evaluated, so the cast must tolerate NaN, inf and values beyond Int64
+                    is_int = v.is_finite() & (v == v.floor()) & (v.abs() < self.INT64_LIMIT)
+                    expr = pl.when(is_int).then(v.cast(pl.Int64, strict=False).cast(pl.Utf8)).otherwise(v.cast(pl.Utf8))
+                else:
+                    expr = pl.lit("0")
+            elif data_key and data_key in df.columns:
+                expr = pl.col(data_key).cast(pl.Utf8).fill_null("")
             else:
-                val = row.get(data_key, "") if data_key else ""
-            values.append(str(val))
-        return tuple(values)
+                expr = pl.lit("")
+            exprs.append(expr.alias(col))
+
+        return [(row[0], row[1:]) for row in df.select(exprs).iter_rows()]
+
+    def insert_row(self, iid: str, values: tuple, index: int | str = "end") -> None:
+        """Insert a new row item into the tree (appended by default)."""
+        self.tree.insert("", index, iid=iid, values=values)
+        self.row_values[iid] = values
+
+    def populate_rows(self, rows: list[tuple[str, tuple]]) -> None:
+        """Show the given (iid, values) rows in an empty tree, inserting only the first page right away.
+
+        The remaining rows are inserted in frame-sized batches from the event loop; flush_rows inserts
+        them immediately for callers that need every item to exist.
+        """
+        self._cancel_fill()
+        head = rows[: self.FIRST_PAGE_ROWS]
+        # Inserting at index 0 in reverse order is cheaper than appending in ttk
+        for iid, values in reversed(head):
+            self.insert_row(iid, values, index=0)
+
+        # Filled from the end, so the tail is briefly out of order below the first page until it completes
+        self._pending_rows = rows[len(head) :]
+        self._fill_index = len(head)
+        if self._pending_rows:
+            self._fill_job = self.after(1, self._fill_batch, self._fill_generation)
+
+    def _fill_batch(self, generation: int) -> None:
+        # Insert rows until the frame budget is spent, then yield to the event loop
+        if generation != self._fill_generation:
+            return  # Superseded by a newer populate, flush or clear
+        self._fill_job = None
+        deadline = time.perf_counter() + self.POPULATE_FRAME_BUDGET
+        while self._pending_rows:
+            iid, values = self._pending_rows.pop()
+            self.insert_row(iid, values, index=self._fill_index)
+            if time.perf_counter() >= deadline:
+                break
+        if self._pending_rows:
+            self._fill_job = self.after(1, self._fill_batch, generation)
+
+    def flush_rows(self) -> None:
+        """Insert all rows populate_rows has not inserted yet."""
+        if not self._pending_rows:
+            return
+        self._cancel_fill()
+        while self._pending_rows:
+            iid, values = self._pending_rows.pop()
+            self.insert_row(iid, values, index=self._fill_index)
+
+    def _cancel_fill(self) -> None:
+        self._fill_generation += 1
+        if self._fill_job is not None:
+            self.after_cancel(self._fill_job)
+            self._fill_job = None
+
+    def begin_bulk_update(self) -> None:
+        """Hide the tree and disable selection so bulk inserts don't relayout or fire select events per row."""
+        self.tree.grid_remove()
+        self.tree.configure(selectmode="none")
+
+    def end_bulk_update(self) -> None:
+        """Restore the tree after begin_bulk_update and lay it out once."""
+        self.tree.configure(selectmode="extended")
+        self.tree.grid()
+        self.tree.update_idletasks()
+
+    def set_row_values(self, iid: str, values: tuple) -> None:
+        """Update the values of an existing row item."""
+        self.flush_rows()
+        self.tree.item(iid, values=values)
+        self.row_values[iid] = values
+
+    def clear_rows(self) -> None:
+        """Delete all row items, including detached ones."""
+        self._cancel_fill()
+        self._pending_rows.clear()
+        if self.row_values:
+            self.tree.delete(*self.row_values)
+        self.row_values.clear()
+
+    def show_rows(self, rows: list[tuple[str, tuple]]) -> None:
+        """Show exactly the given (iid, values) rows in order.
+
+        Existing items are reordered with move() and hidden with detach() instead of being
+        deleted and re-inserted, so only rows whose values changed are touched.
+        """
+        self.flush_rows()
+        children = self.tree.get_children()
+        order = tuple(iid for iid, _ in rows)
+
+        # Same rows in the same order (e.g. a refresh after edits): only values can differ
+        if children == order:
+            for iid, values in rows:
+                if self.row_values.get(iid) != values:
+                    self.set_row_values(iid, values)
+            return
+
+        # Restructure while unmapped, like a populate, so Tk lays the tree out once at the end
+        self.begin_bulk_update()
+        try:
+            visible = set(order)
+            hidden = [iid for iid in children if iid not in visible]
+            if hidden:
+                self.tree.detach(*hidden)
+
+            # Back-to-front at index 0, as ttk walks the siblings up to the index on every insert/move
+            for iid, values in reversed(rows):
+                current = self.row_values.get(iid)
+                if current is None:
+                    self.insert_row(iid, values, index=0)
+                    continue
+
+                if current != values:
+                    self.set_row_values(iid, values)
+                self.tree.move(iid, "", 0)
+        finally:
+            self.end_bulk_update()
@@ -2,9 +2,14 @@
 
 import contextlib
 import logging
+import multiprocessing
+import os
+import queue
 import threading
 import time
 import tkinter as tk
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog
 from typing import TYPE_CHECKING, Final
@@ -35,7 +40,6 @@ from df_metadata_customizer.image_utils import LRUCTKImageCache
 from df_metadata_customizer.rule_manager import RuleManager
 from df_metadata_customizer.settings_manager import SettingsManager
 from df_metadata_customizer.song_metadata import MetadataFields
-from df_metadata_customizer.widgets import RuleRow
 
 if TYPE_CHECKING:
     from df_metadata_customizer.song_metadata import SongMetadata
@@ -74,6 +78,18 @@ class DFApp(ctk.CTk):
         "is not latest version",
     ]
 
+    # Worker threads used for file I/O bound work (tag parsing, writes)
+    MAX_IO_WORKERS: Final = 8
+
+    # Tag writes mostly wait on open/seek/fsync, so oversubscribe the CPUs to overlap that latency
+    MAX_WRITE_WORKERS: Final = min(32, (os.cpu_count() or 1) * 4)
+
+    # Upper bound of files per parse task, so process workers aren't paid an IPC round-trip per file
+    PARSE_CHUNK_SIZE: Final = 32
+
+    # Below this many files to parse, starting worker processes costs more than it saves, so threads are used
+    PROCESS_PARSE_MIN_FILES: Final = 500
+
     def __init__(self) -> None:
         """Initialize the main application window."""
         super().__init__()
@@ -104,6 +120,10 @@ class DFApp(ctk.CTk):
         self.current_metadata: SongMetadata | None = None
 
         self.visible_file_indices = []  # Track visible files for prev/next navigation
+        self._visible_pos: dict[int, int] = {}  # file index -> position in visible_file_indices
+        self._tree_select_job: str | None = None  # Pending coalesced selection update
+        self._parse_pool: Executor | None = None  # Process pool of the load in progress, if any
+        self._io_pool: ThreadPoolExecutor | None = None  # Lazily created pool for tag writing
         self.progress_dialog = None  # Progress dialog reference
         self.operation_in_progress = False  # Prevent multiple operations
 
@@ -112,7 +132,9 @@ class DFApp(ctk.CTk):
 
         # Cover image settings - OPTIMIZED
         self.cover_cache = LRUCTKImageCache(max_size=50)  # Optimized cache
-        self.last_cover_request_time = 0.0  # Track last cover request time for throttling
+        self._cover_queue: queue.Queue[str] = queue.Queue()  # Cover paths waiting for the cover worker
+        self._cover_worker: threading.Thread | None = None  # Started on the first cover request
+        self._cover_request_path: str | None = None  # Most recently requested cover, older loads are discarded
 
         # Maximum number of allowed sort rules (including the primary rule)
         self.max_rules_per_tab = 50
@@ -288,17 +310,56 @@ class DFApp(ctk.CTk):
             """Load file data in background thread."""
             total = len(self.song_files)
 
-            # Pre-load all file data first
-            for i, p in enumerate(self.song_files):
+            # Only files not cached yet need parsing; everything else skips the pool entirely
+            missing = self.file_manager.get_unloaded_paths(self.song_files)
+            if missing:
+                # Files unchanged since the last session come from the on-disk cache instead
+                missing = self.file_manager.stage_from_disk_cache(missing, SettingsManager.load_metadata_cache())
+            done = total - len(missing)
+
+            # Parsing is CPU-bound, so large loads are spread over processes instead of GIL-bound threads.
+            # Files are sent in chunks (still several per worker, to balance load) to amortize IPC.
+            executor = self._get_parse_pool(len(missing))
+            try:
+                load_chunks(executor, missing, done, total)
+            finally:
+                # Worker processes are only kept for the duration of one load
+                self._release_parse_pool(executor)
+
+        def load_chunks(executor: Executor, missing: list[str], done: int, total: int) -> None:
+            """Parse the missing files on executor and stage the results, reporting progress."""
+            chunk_size = max(1, min(self.PARSE_CHUNK_SIZE, len(missing) // (4 * (os.cpu_count() or 1))))
+            chunks = [missing[k : k + chunk_size] for k in range(0, len(missing), chunk_size)]
+            futures = {executor.submit(song_utils.read_songs_tags, chunk): chunk for chunk in chunks}
+            last_post = 0.0
+            i = done
+            for future in as_completed(futures):
                 # Check for cancellation
                 if self.progress_dialog and self.progress_dialog.cancelled:
+                    for f in futures:
+                        f.cancel()
                     self.after_idle(lambda: on_data_loaded(success=False))
                     return
 
-                self.file_manager.get_file_data(p)
-
-                # Update progress every 10 files
-                if i % 10 == 0:
+                chunk = futures[future]
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    # A worker died; drop the pool and parse the chunks it still owed on this thread
+                    logger.exception("Tag-parsing pool broke, parsing %d files on the loader thread", len(chunk))
+                    self._release_parse_pool(executor)
+                    results = song_utils.read_songs_tags(chunk)
+                except Exception:
+                    logger.exception("Error parsing tags for %d files starting at %s", len(chunk), chunk[0])
+                    results = [(None, (None, {}))] * len(chunk)
+                for path, (stamp, tags) in zip(chunk, results, strict=True):
+                    self.file_manager.stage_parsed_tags(path, stamp, tags)
+                i += len(chunk)
+
+                # Post progress at most as often as the dialog can redraw it
+                now = time.monotonic()
+                if now - last_post >= ProgressDialog.MIN_UPDATE_INTERVAL:
+                    last_post = now
                     self.after_idle(lambda idx=i: update_loading_progress(idx, total))
 
             # Done
@@ -321,62 +382,36 @@ class DFApp(ctk.CTk):
             sorted_df = RuleManager.apply_multi_sort_polars(self.sorting_component.sort_rules, df)
 
             # Clear tree first
-            for it in self.tree_component.tree.get_children():
-                self.tree_component.tree.delete(it)
+            self.tree_component.clear_rows()
 
-            # Populate tree in batches for better performance
-            self.visible_file_indices = []
+            # Format all row values up front in one Polars pass
+            sorted_rows = self.tree_component.get_rows(sorted_df)
 
-            # Convert to list of dicts for iteration (still needed for treeview insertion)
-            sorted_rows = sorted_df.to_dicts()
+            self.set_visible_indices([int(iid) for iid, _ in sorted_rows])
 
-            batch_size = 50
+            # Only the first page is inserted before the tree is shown; the rest fills in while it is usable
+            self.tree_component.begin_bulk_update()
+            self.tree_component.populate_rows(sorted_rows)
+            self.tree_component.end_bulk_update()
 
-            def populate_batch(start_idx: int) -> None:
-                end_idx = min(start_idx + batch_size, len(sorted_rows))
-                for i in range(start_idx, end_idx):
-                    row = sorted_rows[i]
-                    orig_idx = row["orig_index"]
+            if sorted_rows:
+                # Indices refer to the new song list, so force the first row to load
+                self.current_index = None
+                self.tree_component.tree.selection_set(sorted_rows[0][0])
+                self.on_tree_select()
 
-                    self.tree_component.tree.insert(
-                        "",
-                        "end",
-                        iid=str(orig_idx),
-                        values=self.tree_component.get_row_values(row),
-                    )
-                    self.visible_file_indices.append(orig_idx)
-
-                # Update progress for tree population
-                if self.progress_dialog:
-                    self.progress_dialog.update_progress(
-                        end_idx,
-                        len(sorted_rows),
-                        f"Building list... {end_idx}/{len(sorted_rows)}",
-                    )
-
-                if end_idx < len(sorted_rows):
-                    # Schedule next batch
-                    self.after(1, lambda: populate_batch(end_idx))
-                else:
-                    # All data loaded
-                    if self.tree_component.tree.get_children():
-                        self.tree_component.tree.selection_set(self.tree_component.tree.get_children()[0])
-                        self.on_tree_select()
-
-                    self.lbl_file_info.configure(text=f"Loaded {len(self.song_files)} files")
-                    self.song_controls_component.btn_select_folder.configure(state="normal")
-                    self.operation_in_progress = False
-
-                    # Calculate statistics after loading
-                    self.statistics_component.calculate_statistics()
+            self.lbl_file_info.configure(text=f"Loaded {len(self.song_files)} files")
+            self.song_controls_component.btn_select_folder.configure(state="normal")
+            self.operation_in_progress = False
 
-                    # Close progress dialog after a brief delay
-                    if self.progress_dialog:
-                        self.after(500, self.progress_dialog.destroy)
-                        self.progress_dialog = None
+            # Calculate statistics after loading
+            self.statistics_component.calculate_statistics()
 
-            # Start batch population
-            populate_batch(0)
+            # Close progress dialog after a brief delay
+            if self.progress_dialog:
+                self.progress_dialog.update_progress(len(sorted_rows), len(sorted_rows), "Building list...")
+                self.after(500, self.progress_dialog.destroy)
+                self.progress_dialog = None
 
         # Start background loading
         threading.Thread(
@@ -392,37 +427,86 @@ class DFApp(ctk.CTk):
 
         path = self.song_files[self.current_index]
 
-        # Prevent UI blocking
-        current_time = time.time()
-        if current_time - self.last_cover_request_time < 0.1:  # TODO: Remove on non-performant mode
-            return
-        self.last_cover_request_time = current_time
-
         # Check cache first - this is very fast
         cached_img = self.cover_cache.get(path)
         if cached_img:
+            self._cover_request_path = path
             self.display_cover_image(cached_img)
+        else:
+            # Show loading message
+            self.song_edit_component.show_loading_cover()
+
+            # Load art when free
+            self.load_cover_art(path)
+
+        self.prefetch_neighbor_covers()
+
+    def prefetch_neighbor_covers(self) -> None:
+        """Warm the cover cache for the next and previous visible songs in the background."""
+        if self.current_index is None:
             return
 
-        # Show loading message
-        self.song_edit_component.show_loading_cover()
+        pos = self._visible_pos.get(self.current_index)
+        if pos is None:
+            return
 
-        # Load art when free
-        threading.Thread(target=self.load_cover_art, args=(path,), daemon=True).start()
+        paths = [
+            self.song_files[self.visible_file_indices[i]]
+            for i in (pos + 1, pos - 1)
+            if 0 <= i < len(self.visible_file_indices)
+        ]
+        paths = [p for p in paths if self.cover_cache.get(p) is None]
+        if paths:
+            self._get_io_pool().submit(self._prefetch_covers, paths)
+
+    def _prefetch_covers(self, paths: list[str]) -> None:
+        """Read and cache covers without displaying them."""
+        for path in paths:
+            img = song_utils.read_cover_from_song(path)
+            if img:
+                self.cover_cache.put(path, img)
 
     def load_cover_art(self, path: str) -> None:
         """Request loading of cover art for the given file path."""
+        self._cover_request_path = path
+        self._cover_queue.put(path)
+        if self._cover_worker is None:
+            self._cover_worker = threading.Thread(target=self._cover_loading_worker, daemon=True)
+            self._cover_worker.start()
+
+    def _cover_loading_worker(self) -> None:
+        """Load requested covers one at a time, blocking while idle."""
+        while True:
+            path = self._cover_queue.get()
+            # Requests that piled up while the last cover loaded are superseded by the newest one
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    path = self._cover_queue.get_nowait()
+            self._read_cover_art(path)
+
+    def _read_cover_art(self, path: str) -> None:
+        """Read and resize a cover on a worker thread, then hand the result to the UI thread."""
         try:
             img = song_utils.read_cover_from_song(path)
-            if img:
-                ctk_image = self.cover_cache.put(path, img)
-                self.display_cover_image(ctk_image)
-            else:
-                self.song_edit_component.show_no_cover()
-
+            ctk_image = self.cover_cache.put(path, img) if img else None
         except Exception:
             logger.exception("Error loading cover")
+            self.after(0, lambda: self._on_cover_art_loaded(path, None, error=True))
+            return
+
+        self.after(0, lambda: self._on_cover_art_loaded(path, ctk_image))
+
+    def _on_cover_art_loaded(self, path: str, ctk_image: ctk.CTkImage | None, *, error: bool = False) -> None:
+        # Drop results for songs the user has already navigated away from
+        if path != self._cover_request_path:
+            return
+
+        if error:
             self.song_edit_component.show_cover_error()
+        elif ctk_image:
+            self.display_cover_image(ctk_image)
+        else:
+            self.song_edit_component.show_no_cover()
 
     def display_cover_image(self, ctk_image: ctk.CTkImage | None) -> None:
         """Display cover image centered in the square container."""
@@ -459,10 +543,6 @@ class DFApp(ctk.CTk):
             self.json_edit_component.update_theme()
             self.output_preview_component.update_theme()
 
-            # Refresh the tree to apply new styles
-            if self.tree_component.tree.get_children():
-                self.after(0, self.refresh_tree)
-
             # Always load cover after theme change
             self.song_edit_component.show_loading_cover()
             if self.current_index is not None:
@@ -620,9 +700,47 @@ class DFApp(ctk.CTk):
             SettingsManager.auto_reopen_last_folder = False
             self.save_settings()
 
+    def _get_parse_pool(self, file_count: int) -> Executor:
+        """Return an executor for parsing file_count files' tags.
+
+        Large loads get a process pool, released with _release_parse_pool; small ones use the shared I/O threads.
+        """
+        if file_count < self.PROCESS_PARSE_MIN_FILES:
+            return self._get_io_pool()
+        try:
+            # Forking the multi-threaded Tk process can deadlock, so always spawn (as on Windows and frozen builds)
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        except (OSError, NotImplementedError):
+            logger.exception("Process pool unavailable, parsing tags on threads instead")
+            return self._get_io_pool()
+        return self._parse_pool
+
+    def _release_parse_pool(self, pool: Executor) -> None:
+        """Shut down a process pool from _get_parse_pool (the shared I/O pool is left running)."""
+        if pool is self._parse_pool:
+            self._parse_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Return the shared file I/O thread pool, kept alive across loads and apply runs."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.MAX_WRITE_WORKERS)
+        return self._io_pool
+
     def _on_close(self) -> None:
         with contextlib.suppress(Exception):
             self.save_settings()
+        with contextlib.suppress(Exception):
+            cache = self.file_manager.export_disk_cache(SettingsManager.load_metadata_cache())
+            SettingsManager.save_metadata_cache(cache)
+
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
 
         try:
             self.destroy()
@@ -654,7 +772,7 @@ class DFApp(ctk.CTk):
         values = tuple(field_values[col] for col in self.tree_component.column_order)
 
         # Update the treeview item
-        self.tree_component.tree.item(str(index), values=values)
+        self.tree_component.set_row_values(str(index), values)
 
     # -------------------------
     # Filename Editing Functions
@@ -765,31 +883,29 @@ class DFApp(ctk.CTk):
 
         # Create and show progress dialog IMMEDIATELY
         self.progress_dialog = ProgressDialog(self, "Loading Folder")
-        self.progress_dialog.update_progress(0, 100, "Finding song files...")
+        # The total is unknown until the walk finishes, so don't pre-count; just animate
+        self.progress_dialog.set_indeterminate(indeterminate=True)
+        self.progress_dialog.label.configure(text="Finding song files...")
 
         def update_scan_progress(count: int) -> None:
             if self.progress_dialog:
-                self.progress_dialog.update_progress(count, count, f"Found {count} files...")
+                self.progress_dialog.update_text(f"Found {count} files...")
 
         # Scan in background thread
         def scan_folder() -> None:
             try:
                 files = []
-                count = 0
 
-                # Use pathlib for faster file discovery
-                for p in Path(folder).rglob("*"):
+                for count, p in enumerate(song_utils.iter_song_files(folder), start=1):
                     # Check for cancellation
                     if self.progress_dialog and self.progress_dialog.cancelled:
                         self.after_idle(lambda: on_scan_complete(None))
                         return
 
-                    if p.is_file() and p.suffix.lower() in song_utils.SUPPORTED_FILES_TYPES:
-                        files.append(str(p))
-                        count += 1
-                        # Update progress every 10 files
-                        if count % 10 == 0:
-                            self.after_idle(lambda c=count: update_scan_progress(c))
+                    files.append(p)
+                    # Update progress every 10 files
+                    if count % 10 == 0:
+                        self.after_idle(lambda c=count: update_scan_progress(c))
 
                 self.after_idle(lambda: on_scan_complete(files))
             except Exception:
@@ -820,8 +936,8 @@ class DFApp(ctk.CTk):
 
             # Update progress for metadata loading
             if self.progress_dialog:
+                self.progress_dialog.set_indeterminate(indeterminate=False)
                 self.progress_dialog.label.configure(text="Loading file metadata...")
-                self.progress_dialog.progress.set(0)
 
             self.current_folder = folder
 
@@ -845,22 +961,10 @@ class DFApp(ctk.CTk):
         # Apply multi-level sort
         sorted_df = RuleManager.apply_multi_sort_polars(self.sorting_component.sort_rules, filtered_df)
 
-        # Clear tree
-        for it in self.tree_component.tree.get_children():
-            self.tree_component.tree.delete(it)
-        self.visible_file_indices = []
-
-        # Insert sorted matches into the tree
-        sorted_rows = sorted_df.to_dicts()
-        for row in sorted_rows:
-            orig_idx = row["orig_index"]
-            self.tree_component.tree.insert(
-                "",
-                "end",
-                iid=str(orig_idx),
-                values=self.tree_component.get_row_values(row),
-            )
-            self.visible_file_indices.append(orig_idx)
+        # Reorder/detach existing rows instead of rebuilding the tree
+        sorted_rows = self.tree_component.get_rows(sorted_df)
+        self.set_visible_indices([int(iid) for iid, _ in sorted_rows])
+        self.tree_component.show_rows(sorted_rows)
 
         # Update search info label with count and filter summary
         info = f"{len(self.visible_file_indices)} songs found"
@@ -874,12 +978,23 @@ class DFApp(ctk.CTk):
 
     def on_tree_select(self, _event: tk.Event | None = None) -> None:
         """Handle tree selection change."""
+        # Coalesce bursts of selection events (and explicit calls) into one update once Tk is idle
+        if self._tree_select_job is None:
+            self._tree_select_job = self.after_idle(self._apply_tree_selection)
+
+    def _apply_tree_selection(self) -> None:
+        self._tree_select_job = None
         sel = self.tree_component.tree.selection()
         # Update selection count
         self.lbl_selection_info.configure(text=f"{len(sel)} song(s) selected")
 
         if not sel:
             return
+
+        # Keep the loaded song if it is still selected (e.g. select all, or navigation that already loaded it)
+        if self.current_index is not None and str(self.current_index) in sel:
+            return
+
         iid = sel[0]
         try:
             idx = int(iid)
@@ -915,44 +1030,33 @@ class DFApp(ctk.CTk):
         # Update Song Edit View
         self.after_idle(lambda: self.song_edit_component.update_view(self.current_metadata))
 
+    def set_visible_indices(self, indices: list[int]) -> None:
+        """Set the visible file order and its reverse lookup used for navigation."""
+        self.visible_file_indices = indices
+        self._visible_pos = {idx: pos for pos, idx in enumerate(indices)}
+
     def prev_file(self) -> None:
         """Navigate to previous file in the visible list."""
-        if not self.visible_file_indices:
-            return
-
-        current_visible_index = None
-        if self.current_index is not None:
-            try:
-                current_visible_index = self.visible_file_indices.index(self.current_index)
-            except ValueError:
-                current_visible_index = None
-
+        current_visible_index = self._visible_pos.get(self.current_index)
         if current_visible_index is None or current_visible_index <= 0:
             return
 
         # Get previous file index from visible list
         prev_index = self.visible_file_indices[current_visible_index - 1]
+        self.tree_component.flush_rows()
         self.tree_component.tree.selection_set(str(prev_index))
         self.current_index = prev_index
         self.load_current()
 
     def next_file(self) -> None:
         """Navigate to next file in the visible list."""
-        if not self.visible_file_indices:
-            return
-
-        current_visible_index = None
-        if self.current_index is not None:
-            try:
-                current_visible_index = self.visible_file_indices.index(self.current_index)
-            except ValueError:
-                current_visible_index = None
-
+        current_visible_index = self._visible_pos.get(self.current_index)
         if current_visible_index is None or current_visible_index >= len(self.visible_file_indices) - 1:
             return
 
         # Get next file index from visible list
         next_index = self.visible_file_indices[current_visible_index + 1]
+        self.tree_component.flush_rows()
         self.tree_component.tree.selection_set(str(next_index))
         self.current_index = next_index
         self.load_current()
@@ -960,6 +1064,8 @@ class DFApp(ctk.CTk):
     def on_select_all(self) -> None:
         """Handle select all checkbox toggle."""
         sel = self.song_controls_component.select_all_var.get()
+        # Every visible row must be in the tree before it can be selected
+        self.tree_component.flush_rows()
         if sel:
             # select all visible
             self.tree_component.tree.selection_set(self.tree_component.tree.get_children())
@@ -973,14 +1079,8 @@ class DFApp(ctk.CTk):
     # -------------------------
     def collect_rules_for_tab(self, key: str) -> list[dict[str, str]]:
         """Key in 'title','artist','album' - Enhanced for AND/OR grouping."""
-        container = self.rule_tabs_component.rule_containers.get(key)
-        if not container:
-            return []
         rules = []
-        slaves = container.pack_slaves()
-        children = [w for w in slaves if isinstance(w, RuleRow)]
-
-        for i, widget in enumerate(children):
+        for i, widget in enumerate(self.rule_tabs_component.rule_rows.get(key, ())):
             rule_data = widget.get_rule()
             # Ensure first rule has proper logic flag
             if i == 0:
@@ -993,24 +1093,29 @@ class DFApp(ctk.CTk):
     # -------------------------
     def apply_to_selected(self) -> None:
         """Apply metadata changes to selected files."""
-        if self.operation_in_progress:
-            messagebox.showinfo("Operation in progress", "Please wait for the current operation to complete.")
-            return
-
         sel = self.tree_component.tree.selection()
         if not sel:
             messagebox.showwarning("No selection", "Select rows in the song list first")
             return
 
-        paths = [self.song_files[int(iid)] for iid in sel]
+        self._apply_paths([self.song_files[int(iid)] for iid in sel])
 
-        # Collect rules on main thread BEFORE starting background thread
-        title_rules = self.collect_rules_for_tab("title")
-        artist_rules = self.collect_rules_for_tab("artist")
-        album_rules = self.collect_rules_for_tab("album")
+    def _apply_paths(self, paths: list[str]) -> None:
+        """Apply the current rules to the given files in the background with a progress dialog."""
+        if self.operation_in_progress:
+            messagebox.showinfo("Operation in progress", "Please wait for the current operation to complete.")
+            return
+
+        # Collect and compile rules once on the main thread BEFORE starting background thread
+        title_rules = RuleManager.compile_rules(self.collect_rules_for_tab("title"))
+        artist_rules = RuleManager.compile_rules(self.collect_rules_for_tab("artist"))
+        album_rules = RuleManager.compile_rules(self.collect_rules_for_tab("album"))
 
         self.operation_in_progress = True
 
+        # Commit staged data here so worker threads only read from the FileManager
+        self.file_manager.commit()
+
         # Show immediate feedback
         self.lbl_file_info.configure(text=f"Starting to apply to {len(paths)} files...")
         self.update_idletasks()
@@ -1023,66 +1128,72 @@ class DFApp(ctk.CTk):
             if self.progress_dialog:
                 self.progress_dialog.update_progress(current, total, text)
 
+        def apply_one(p: str) -> str | None:
+            """Apply the rules to one file. Returns an error message or None on success."""
+            try:
+                # Fail read-only files (or volumes) with one syscall instead of a full tag load
+                if not os.access(p, os.W_OK):
+                    return f"Not writable: {Path(p).name}"
+
+                metadata = self.file_manager.get_metadata(p)
+                if not metadata.raw_data:
+                    return f"No metadata: {Path(p).name}"
+
+                # None leaves the tag untouched when no rule produces a value
+                new_title = RuleManager.apply_compiled_rules(title_rules, metadata, default=None)
+                new_artist = RuleManager.apply_compiled_rules(artist_rules, metadata, default=None)
+                new_album = RuleManager.apply_compiled_rules(album_rules, metadata, default=None)
+
+                # write tags
+                if not song_utils.write_id3_tags(
+                    p,
+                    title=new_title,
+                    artist=new_artist,
+                    album=new_album,
+                    track=metadata.track,
+                    disc=metadata.disc,
+                    date=metadata.date,
+                ):
+                    return f"Failed to write: {Path(p).name}"
+
+            except Exception as e:
+                return f"Error with {Path(p).name}: {e!s}"
+            return None
+
         def apply_in_background() -> None:
-            """Apply metadata changes in background thread."""
+            """Apply metadata changes in background thread, writing several files at once."""
             success_count = 0
             total = len(paths)
             errors = []
 
-            for i, p in enumerate(paths):
+            executor = self._get_io_pool()
+            futures = {executor.submit(apply_one, p): p for p in paths}
+            last_post = 0.0
+            for i, future in enumerate(as_completed(futures), start=1):
                 if self.progress_dialog and self.progress_dialog.cancelled:
+                    # The pool is shared, so only drop this run's queued writes
+                    for pending in futures:
+                        pending.cancel()
                     break
 
-                try:
-                    metadata = self.file_manager.get_metadata(p)
-                    if not metadata.raw_data:
-                        errors.append(f"No metadata: {Path(p).name}")
-                        continue
-
-                    new_title = RuleManager.apply_rules_list(
-                        title_rules,
-                        metadata,
-                    )
-                    new_artist = RuleManager.apply_rules_list(
-                        artist_rules,
-                        metadata,
-                    )
-                    new_album = RuleManager.apply_rules_list(
-                        album_rules,
-                        metadata,
+                error = future.result()
+                if error:
+                    errors.append(error)
+                else:
+                    success_count += 1
+
+                # Post progress at most as often as the dialog can redraw it, plus the final count
+                now = time.monotonic()
+                if i == total or now - last_post >= ProgressDialog.MIN_UPDATE_INTERVAL:
+                    last_post = now
+                    self.after_idle(
+                        lambda idx=i, path=futures[future]: update_apply_progress(
+                            idx,
+                            total,
+                            f"Applying to {idx}/{total}: {Path(path).name}",
+                        ),
                     )
 
-                    # write tags
-                    cover_bytes = None
-                    cover_mime = "image/jpeg"
-
-                    if song_utils.write_id3_tags(
-                        p,
-                        title=new_title,
-                        artist=new_artist,
-                        album=new_album,
-                        track=metadata.track,
-                        disc=metadata.disc,
-                        date=metadata.date,
-                        cover_bytes=cover_bytes,
-                        cover_mime=cover_mime,
-                    ):
-                        success_count += 1
-                    else:
-                        errors.append(f"Failed to write: {Path(p).name}")
-
-                except Exception as e:
-                    errors.append(f"Error with {Path(p).name}: {e!s}")
-
-                # Update progress
-                self.after_idle(
-                    lambda idx=i, path=p: update_apply_progress(
-                        idx + 1,
-                        total,
-                        f"Applying to {idx + 1}/{total}: {Path(path).name}",
-                    ),
-                )
-
             # Done
             self.after_idle(lambda: on_apply_complete((success_count, errors)))
 
@@ -1126,9 +1237,8 @@ class DFApp(ctk.CTk):
         if not res:
             return
 
-        # Select all files for processing
-        self.tree_component.tree.selection_set(self.tree_component.tree.get_children())
-        self.apply_to_selected()
+        # Hand the paths over directly instead of round-tripping through the tree selection
+        self._apply_paths(list(self.song_files))
 
     # -------------------------
     # Preset save/load - UPDATED: Individual files in presets folder
@@ -1225,34 +1335,21 @@ class DFApp(ctk.CTk):
             # In on_preset_selected method, update the rule loading section:
             for key in ("title", "artist", "album"):
                 cont = self.rule_tabs_component.rule_containers.get(key)
-                # destroy existing RuleRow children
-                for w in cont.winfo_children():
-                    w.destroy()
-                rules = preset.get(key, [])
-
-                # Apply rule limit when loading from preset
-                rules_to_load = rules[: self.max_rules_per_tab]
-
-                for i, r in enumerate(rules_to_load):
-                    is_first = i == 0
-                    row = RuleRow(
-                        cont,
-                        DFApp.RULE_OPS,
-                        move_callback=self.rule_tabs_component.move_rule,
-                        delete_callback=self.rule_tabs_component.delete_rule,
-                        is_first=is_first,
-                    )
-                    row.pack(fill="x", padx=6, pady=3)
-                    row.field_var.set(r.get("if_field", MetadataFields.get_json_keys()[0]))
-                    row.op_var.set(r.get("if_operator", DFApp.RULE_OPS[0]))
-                    row.value_entry.insert(0, r.get("if_value", ""))
-                    row.template_entry.insert(0, r.get("then_template", ""))
-                    # Set logic for non-first rules
-                    if not is_first:
-                        row.logic_var.set(r.get("logic", "AND"))
-
-                # Update arrow states
-                self.rule_tabs_component.update_rule_button_states(cont)
+                # Swap the rows while the container is hidden, so the tab is laid out once
+                self.rule_tabs_component.begin_bulk_update(key)
+                try:
+                    # Remove existing RuleRow children (kept for reuse by the rows added below)
+                    self.rule_tabs_component.clear_rules(key)
+                    rules = preset.get(key, [])
+
+                    # Apply rule limit when loading from preset
+                    for r in rules[: self.max_rules_per_tab]:
+                        self.rule_tabs_component.add_preset_rule(key, r)
+
+                    # Update arrow states
+                    self.rule_tabs_component.update_rule_button_states(cont)
+                finally:
+                    self.rule_tabs_component.end_bulk_update(key)
 
             # Update button states after loading preset
             self.rule_tabs_component.update_rule_tab_buttons()
@@ -1279,6 +1376,8 @@ class DFApp(ctk.CTk):
 
 def main() -> None:
     """Run main entry point."""
+    # Required for the tag-parsing process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     app = DFApp()
     app.run()
 
@@ -3,6 +3,7 @@
 import logging
 import os
 from collections import defaultdict
+from concurrent.futures import as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -86,22 +87,36 @@ class DuplicationCheckDialog(ctk.CTkToplevel):
 
         progress = ProgressDialog(self.app, title="Checking for duplicates...")
 
+        song_files = list(self.app.song_files)
+        total_files = len(song_files)
+        file_hashes: dict[str, str | None] = {}
+
+        # File reads and SHA-256 both release the GIL, so several files are hashed truly in parallel
+        executor = self.app._get_io_pool()  # noqa: SLF001
+        futures = {executor.submit(song_utils.get_audio_hash, file_path): file_path for file_path in song_files}
+        try:
+            for i, future in enumerate(as_completed(futures)):
+                file_path = futures[future]
+                if not progress.update_progress(i, total_files, f"Hashing: {Path(file_path).name}"):
+                    logger.info("Duplication check cancelled.")
+                    self.destroy()
+                    return
+
+                try:
+                    file_hashes[file_path] = future.result()
+                except Exception:
+                    logger.exception("Failed to hash %s", file_path)
+        finally:
+            # The pool is shared with the app, so only drop this check's queued work
+            for future in futures:
+                future.cancel()
+
+        # Group in song list order, independent of which hash finished first
         hashes: dict[str, list[str]] = defaultdict(list)
-        total_files = len(self.app.song_files)
-
-        for i, file_path in enumerate(self.app.song_files):
-            if not progress.update_progress(i, total_files, f"Hashing: {Path(file_path).name}"):
-                logger.info("Duplication check cancelled.")
-                self.destroy()
-                return
-
-            try:
-                # Use the new function we are adding
-                audio_hash = song_utils.get_audio_hash(file_path)
-                if audio_hash:
-                    hashes[audio_hash].append(file_path)
-            except Exception:
-                logger.exception("Failed to hash %s", file_path)
+        for file_path in song_files:
+            audio_hash = file_hashes.get(file_path)
+            if audio_hash:
+                hashes[audio_hash].append(file_path)
 
         progress.destroy()
 
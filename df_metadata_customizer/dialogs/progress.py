@@ -1,11 +1,17 @@
 """Display progress during long operations."""
 
+import time
+from typing import Final
+
 import customtkinter as ctk
 
 
 class ProgressDialog(ctk.CTkToplevel):
     """Display the progress of a generic operation."""
 
+    # Minimum seconds between two redraws; intermediate updates are dropped
+    MIN_UPDATE_INTERVAL: Final = 0.05
+
     def __init__(self, parent: ctk.CTk, title: str = "Processing...") -> None:
         """Display the progress of a generic operation."""
         super().__init__(parent)
@@ -51,6 +57,8 @@ class ProgressDialog(ctk.CTkToplevel):
         self.cancel_button.grid(row=2, column=0, padx=20, pady=(10, 20))
 
         self.cancelled = False
+        self._last_update = 0.0
+        self._last_percent = 0
 
         # Force the window to appear immediately
         self.update()
@@ -63,9 +71,19 @@ class ProgressDialog(ctk.CTkToplevel):
         if self.cancelled:
             return False
 
+        # Throttle redraws, but always show the final state
+        now = time.monotonic()
+        if current < total and now - self._last_update < self.MIN_UPDATE_INTERVAL:
+            return True
+        self._last_update = now
+
         progress = current / total if total > 0 else 0
         self.progress.set(progress)
-        self.percent_label.configure(text=f"{int(progress * 100)}%")
+        # The label only shows whole percents, so most updates on large batches leave it as is
+        percent = int(progress * 100)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.percent_label.configure(text=f"{percent}%")
 
         if text:
             self.label.configure(text=text)
@@ -76,6 +94,33 @@ class ProgressDialog(ctk.CTkToplevel):
         self.update_idletasks()
         return True
 
+    def update_text(self, text: str) -> bool:
+        """Update only the status text (throttled like update_progress). Returns False if cancelled."""
+        if self.cancelled:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_update < self.MIN_UPDATE_INTERVAL:
+            return True
+        self._last_update = now
+
+        self.label.configure(text=text)
+        self.update_idletasks()
+        return True
+
+    def set_indeterminate(self, *, indeterminate: bool) -> None:
+        """Switch between an animated bar for work of unknown size and normal determinate progress."""
+        if indeterminate:
+            self.progress.configure(mode="indeterminate")
+            self.progress.start()
+            self.percent_label.configure(text="")
+        else:
+            self.progress.stop()
+            self.progress.configure(mode="determinate")
+            self.progress.set(0)
+            self._last_percent = 0
+            self.percent_label.configure(text="0%")
+
     def cancel(self) -> None:
         """Cancel the dialog."""
         self.cancelled = True
@@ -2,17 +2,47 @@
 
 import json
 import re
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
+from typing import Final
 
 import polars as pl
 
 from df_metadata_customizer import song_utils
 from df_metadata_customizer.song_metadata import MetadataFields, SongMetadata
 
+_VERSION_NUMBER_RE = re.compile(r"[-+]?\d*\.\d+|\d+")
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(raw_ver: object) -> float:
+    """Parse a JSON version value into a float (memoized, as the same few values repeat across songs)."""
+    try:
+        return float(raw_ver)
+    except (ValueError, TypeError):
+        # Try extracting number (including decimals)
+        nums = _VERSION_NUMBER_RE.findall(str(raw_ver))
+        return float(nums[0]) if nums else 0.0
+
 
 class FileManager:
     """Manages file metadata using Polars DataFrame."""
 
+    # JSON fields that repeat across many songs, so their values are interned
+    INTERNED_FIELDS: Final = frozenset(
+        {MetadataFields.ARTIST, MetadataFields.COVER_ARTIST, MetadataFields.DATE, MetadataFields.DISC},
+    )
+
+    # Lowercased text of all displayed columns, used for free-text search
+    SEARCH_COLUMN: Final = "search_text"
+
+    # Whether a file holds the highest version of its song_id, added by get_view_data
+    LATEST_COLUMN: Final = "is_latest"
+
     def __init__(self) -> None:
         """Initialize DataFrame storage."""
         # Schema for the DataFrame
@@ -28,19 +58,39 @@ class FileManager:
             MetadataFields.DATE: pl.Utf8,
             MetadataFields.COMMENT: pl.Utf8,
             MetadataFields.SPECIAL: pl.Utf8,
+            MetadataFields.FILE: pl.Utf8,
+            self.SEARCH_COLUMN: pl.Utf8,
             "raw_json": pl.Object,
         }
         self.df = pl.DataFrame(schema=self.schema)
         # Staging area for new/modified data before commit to DF
         self._staging: dict[str, dict] = {}
+        # Disk reads in progress, so concurrent requests for the same file share one parse
+        self._inflight: dict[str, Future[dict]] = {}
+        # Files are loaded and written from worker threads as well as the UI thread
+        self._lock = threading.RLock()
+        # path -> committed JSON, so per-file lookups don't filter the DataFrame
+        self._committed: dict[str, dict] = {}
+        # song_id -> version counts, maintained on commit so version lookups don't scan the DataFrame
+        self._song_versions: dict[str, Counter[float]] = {}
+        self._path_versions: dict[str, tuple[str, float]] = {}
+        # song_id -> highest version, so latest checks are a single probe
+        self._song_latest: dict[str, float] = {}
+        # path -> (mtime_ns, size) of the file when its JSON was read, for the on-disk metadata cache
+        self._stamps: dict[str, tuple[int, int]] = {}
 
     def commit(self) -> None:
         """Commit staged changes to the DataFrame."""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
         if not self._staging:
             return
 
-        # Convert staging to rows
+        # Convert staging to rows; the indexes are only updated once the new frame is built
         rows = []
+        index_updates = []
         for path, jsond in self._staging.items():
             title = jsond.get(MetadataFields.TITLE, "")
             artist = jsond.get(MetadataFields.ARTIST, "")
@@ -48,13 +98,8 @@ class FileManager:
             song_id = f"{title}|{artist}|{cover_artist}"
 
             # Robust version parsing
-            raw_ver = jsond.get(MetadataFields.VERSION, 0)
-            try:
-                version = float(raw_ver)
-            except (ValueError, TypeError):
-                # Try extracting number (including decimals)
-                nums = re.findall(r"[-+]?\d*\.\d+|\d+", str(raw_ver))
-                version = float(nums[0]) if nums else 0.0
+            version = self._version_of(jsond)
+            index_updates.append((path, song_id, version))
 
             rows.append(
                 {
@@ -69,39 +114,76 @@ class FileManager:
                     MetadataFields.DATE: jsond.get(MetadataFields.DATE, ""),
                     MetadataFields.COMMENT: jsond.get(MetadataFields.COMMENT, ""),
                     MetadataFields.SPECIAL: jsond.get(MetadataFields.SPECIAL, ""),
+                    MetadataFields.FILE: Path(path).name,
+                    self.SEARCH_COLUMN: None,
                     "raw_json": jsond,
                 },
             )
 
         new_df = pl.DataFrame(rows, schema=self.schema, orient="row")
 
+        # Build the search text once per change instead of on every search keystroke
+        new_df = new_df.with_columns(self._search_text_expr().alias(self.SEARCH_COLUMN))
+
         # Remove existing paths from main DF that are in staging
         if self.df.height > 0:
             staging_paths = list(self._staging.keys())
-            self.df = self.df.filter(~pl.col("path").is_in(staging_paths))
-            self.df = self.df.vstack(new_df)
-        else:
-            self.df = new_df
+            new_df = self.df.filter(~pl.col("path").is_in(staging_paths)).vstack(new_df)
+
+        # Swap in the frame and its indexes together, so a failure above leaves both untouched
+        self.df = new_df
+        for path, song_id, version in index_updates:
+            self._index_version(path, song_id, version)
+            self._committed[path] = self._staging[path]
 
         self._staging.clear()
 
     def get_song_versions(self, song_id: str) -> list[float]:
         """Get all versions for a song ID."""
         self.commit()
-        if self.df.height == 0:
-            return []
-
-        # Filter DF by song_id
-        versions = self.df.filter(pl.col("song_id") == song_id).select("Version").unique().to_series().to_list()
-        return sorted(versions) if versions else []
+        with self._lock:
+            versions = self._song_versions.get(song_id)
+            return sorted(versions) if versions else []
 
     def get_latest_version(self, song_id: str) -> float:
         """Get latest version string for a song ID."""
-        versions = self.get_song_versions(song_id)
-        if not versions:
-            return 0.0
+        self.commit()
+        with self._lock:
+            return self._song_latest.get(song_id, 0.0)
+
+    def _index_version(self, path: str, song_id: str, version: float) -> None:
+        """Record the song_id and version of a committed file, replacing its previous entry."""
+        self._unindex_version(path)
+        self._path_versions[path] = (song_id, version)
+        self._song_versions.setdefault(song_id, Counter())[version] += 1
+        if song_id not in self._song_latest or version > self._song_latest[song_id]:
+            self._song_latest[song_id] = version
+
+    def _unindex_version(self, path: str) -> None:
+        old = self._path_versions.pop(path, None)
+        if old is None:
+            return
 
-        return max(versions)
+        song_id, version = old
+        counts = self._song_versions[song_id]
+        counts[version] -= 1
+        if counts[version] <= 0:
+            del counts[version]
+        if not counts:
+            del self._song_versions[song_id]
+            del self._song_latest[song_id]
+        elif version == self._song_latest[song_id] and version not in counts:
+            self._song_latest[song_id] = max(counts)
+
+    @staticmethod
+    def _version_of(jsond: dict) -> float:
+        """Parse the version of a song's JSON data."""
+        raw_ver = jsond.get(MetadataFields.VERSION, 0)
+        try:
+            return _parse_version(raw_ver)
+        except TypeError:
+            # Unhashable (e.g. list) values can't be memoized
+            return _parse_version.__wrapped__(raw_ver)
 
     def is_latest_version(self, song_id: str, version: float) -> bool:
         """Check if a given version is the latest for a song ID."""
@@ -109,87 +191,186 @@ class FileManager:
 
     def update_file_data(self, file_path: str, json_data: dict) -> None:
         """Update the file data cache (stages change)."""
-        self._staging[file_path] = json_data
+        with self._lock:
+            self._staging[file_path] = json_data
+            # No longer what was read from disk, so don't persist it with the old stamp
+            self._stamps.pop(file_path, None)
 
     def update_file_path(self, old_path: str, new_path: str) -> None:
         """Update the file path in the cache (e.g., if a file is renamed)."""
         # Get data first
         data = self.get_file_data(old_path)
 
-        # Remove old from staging if present
-        if old_path in self._staging:
-            del self._staging[old_path]
+        with self._lock:
+            # Remove old from staging if present
+            if old_path in self._staging:
+                del self._staging[old_path]
 
-        # Remove old from DF if present
-        if self.df.height > 0:
-            self.df = self.df.filter(pl.col("path") != old_path)
+            # Remove old from DF if present
+            if self.df.height > 0:
+                self.df = self.df.filter(pl.col("path") != old_path)
+            self._committed.pop(old_path, None)
+            self._stamps.pop(old_path, None)
+            self._unindex_version(old_path)
 
-        # Add new to staging
-        self._staging[new_path] = data
+            # Add new to staging
+            self._staging[new_path] = data
 
     def clear(self) -> None:
         """Clear the file data cache."""
-        self.df = self.df.clear()
-        self._staging.clear()
+        with self._lock:
+            self.df = self.df.clear()
+            self._staging.clear()
+            self._committed.clear()
+            self._stamps.clear()
+            self._song_versions.clear()
+            self._path_versions.clear()
+            self._song_latest.clear()
 
     def get_file_data(self, file_path: str) -> dict:
         """Get JSON data from a file."""
+        with self._lock:
+            jsond = self._get_cached_file_data(file_path)
+            if jsond is not None:
+                return jsond
+
+            # Join a read of the same file that is already in progress
+            future = self._inflight.get(file_path)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[file_path] = future
+
+        if not owner:
+            return future.result()
+
+        # Not found, load from disk
+        try:
+            jsond = self.stage_loaded_data(file_path, self._read_song_tags(file_path)[0])
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(jsond)
+            return jsond
+        finally:
+            with self._lock:
+                self._inflight.pop(file_path, None)
+
+    def _get_cached_file_data(self, file_path: str) -> dict | None:
         # Check staging first
         if file_path in self._staging:
             return self._staging[file_path]
 
-        # Check DataFrame
-        if self.df.height > 0:
-            # Filter for the path
-            res = self.df.filter(pl.col("path") == file_path)
-            if not res.is_empty():
-                row = res.row(0, named=True)
-                return row["raw_json"]
+        # Then committed data
+        return self._committed.get(file_path)
 
-        # Not found, load from disk
-        jsond = song_utils.extract_json_from_song(file_path) or {}
+    def get_unloaded_paths(self, paths: list[str]) -> list[str]:
+        """Return the paths whose JSON data is not cached yet, preserving order."""
+        with self._lock:
+            return [p for p in paths if p not in self._staging and p not in self._committed]
+
+    def stage_from_disk_cache(self, paths: list[str], cache: dict[str, list]) -> list[str]:
+        """Stage files that are unchanged since they were cached, and return the paths that still need parsing.
 
+        cache maps path to [mtime_ns, size, json] as produced by export_disk_cache.
+        """
+        missing = []
+        for path in paths:
+            try:
+                st = Path(path).stat()
+            except OSError:
+                missing.append(path)
+                continue
+
+            stamp = (st.st_mtime_ns, st.st_size)
+            entry = cache.get(path)
+            if entry and (entry[0], entry[1]) == stamp:
+                with self._lock:
+                    self._stamps[path] = stamp
+                self.stage_loaded_data(path, entry[2])
+            else:
+                missing.append(path)
+        return missing
+
+    def export_disk_cache(self, cache: dict[str, list]) -> dict[str, list]:
+        """Merge the loaded JSON of files read from disk into cache (keyed by path) and return it.
+
+        Entries of files from other folders are kept, so switching folders doesn't drop them.
+        """
+        with self._lock:
+            for path, (mtime_ns, size) in self._stamps.items():
+                jsond = self._get_cached_file_data(path)
+                if jsond is not None:
+                    cache[path] = [mtime_ns, size, jsond]
+            return cache
+
+    def stage_loaded_data(self, file_path: str, jsond: dict | None) -> dict:
+        """Clean and stage JSON data that was read from disk (possibly in another process)."""
+        jsond = jsond or {}
         if jsond:
-            cleaned_jsond = {}
-            for key, value in jsond.items():
-                if isinstance(value, bytes):
-                    try:
-                        cleaned_jsond[key] = value.decode("utf-8")
-                    except UnicodeDecodeError:
-                        try:
-                            cleaned_jsond[key] = value.decode("latin-1")
-                        except Exception:
-                            cleaned_jsond[key] = str(value)
-                else:
-                    cleaned_jsond[key] = value
-            jsond = cleaned_jsond
+            # Share one string object per distinct key across all files
+            jsond = {sys.intern(key): self._clean_json_value(key, value) for key, value in jsond.items()}
 
         # Stage the loaded data
-        self._staging[file_path] = jsond
+        with self._lock:
+            self._staging[file_path] = jsond
         return jsond
 
+    def stage_parsed_tags(
+        self,
+        file_path: str,
+        stamp: tuple[int, int] | None,
+        tags: tuple[dict | None, dict[str, str]],
+    ) -> dict:
+        """Stage a song_utils.read_songs_tags result, keeping its ID3 half so get_metadata doesn't parse again.
+
+        Only files that parsed (stamp is not None) are saved by export_disk_cache, so failures are retried.
+        """
+        if stamp is not None:
+            song_utils.cache_song_tags(file_path, stamp, tags)
+            with self._lock:
+                # Taken before parsing, so a file modified meanwhile is simply re-read next session
+                self._stamps[file_path] = stamp
+        return self.stage_loaded_data(file_path, tags[0])
+
+    @classmethod
+    def _clean_json_value(cls, key: str, value: object) -> object:
+        """Decode stray bytes values and intern values of low-cardinality fields."""
+        if isinstance(value, bytes):
+            try:
+                value = value.decode("utf-8")
+            except UnicodeDecodeError:
+                value = value.decode("latin-1")
+
+        if isinstance(value, str) and key in cls.INTERNED_FIELDS:
+            return sys.intern(value)
+        return value
+
+    @staticmethod
+    def _read_song_tags(file_path: str) -> tuple[dict | None, dict[str, str]]:
+        """Read JSON and ID3 tags in one parse, memoized on mtime so reloading a folder skips unchanged files."""
+        try:
+            st = Path(file_path).stat()
+        except OSError:
+            return song_utils.read_song_tags(file_path)
+        return song_utils.read_song_tags_cached(file_path, st.st_mtime_ns, st.st_size)
+
     def get_metadata(self, file_path: str) -> SongMetadata:
         """Get SongMetadata object for a file."""
         jsond = self.get_file_data(file_path)
 
-        # Calculate is_latest
-        title = jsond.get(MetadataFields.TITLE, "") or Path(file_path).stem
+        # Calculate is_latest (song_id and version must match how commit() stores them)
+        title = jsond.get(MetadataFields.TITLE, "")
         artist = jsond.get(MetadataFields.ARTIST, "")
         cover_artist = jsond.get(MetadataFields.COVER_ARTIST, "")
         song_id = f"{title}|{artist}|{cover_artist}"
 
-        # Parse version
-        raw_ver = jsond.get(MetadataFields.VERSION, 0)
-        try:
-            version = float(raw_ver)
-        except (ValueError, TypeError):
-            version = 0.0
-
-        is_latest = self.is_latest_version(song_id, version)
+        is_latest = self.is_latest_version(song_id, self._version_of(jsond))
 
         # Load ID3 tags
-        # For now simply store them in memory, no Dataframe usage yet
-        id3_data = song_utils.get_id3_tags(file_path)
+        # Comes from the same memoized parse as the JSON, so this only costs a stat
+        id3_data = self._read_song_tags(file_path)[1]
 
         return SongMetadata(jsond, file_path, is_latest=is_latest, id3_data=id3_data)
 
@@ -223,20 +404,41 @@ class FileManager:
                 [pl.lit("").alias(c) for c in cols if c != MetadataFields.UI_FILE],
             ).with_columns(pl.lit("").alias(MetadataFields.UI_FILE))
 
-        # Join with stored data
-        joined = paths_df.join(self.df, on="path", how="left")
+        # Join with stored data (columns are stored once at commit, so no per-row Python work here)
+        # Latest flags come from one grouped max over the whole library instead of a lookup per song
+        is_latest = pl.col(MetadataFields.VERSION) == pl.col(MetadataFields.VERSION).max().over("song_id")
+        joined = paths_df.join(self.df.with_columns(is_latest.alias(self.LATEST_COLUMN)), on="path", how="left")
+
+        # Files not in DF still get their file name, and can be found by it
+        joined = joined.with_columns(
+            pl.col(MetadataFields.FILE).fill_null(pl.col("path").str.extract(r"([^/\\]+)$", 1)),
+        )
+        joined = joined.with_columns(
+            pl.col(self.SEARCH_COLUMN).fill_null(pl.col(MetadataFields.FILE).str.to_lowercase()),
+        )
 
         # Fill nulls for files not in DF
         joined = joined.with_columns(pl.col(pl.Utf8).fill_null(""))
         joined = joined.with_columns(pl.col(pl.Int64).fill_null(0))
-        joined = joined.with_columns(pl.col(pl.Float64).fill_null(0.0))
+        joined = joined.with_columns(pl.col(self.LATEST_COLUMN).fill_null(value=False))
+        return joined.with_columns(pl.col(pl.Float64).fill_null(0.0))
 
-        # Add 'file' column (filename) using map_elements for safety with paths
-        return joined.with_columns(
-            pl.col("path")
-            .map_elements(lambda p: Path(p).name if p else "", return_dtype=pl.Utf8)
-            .alias(MetadataFields.FILE),
-        )
+    @staticmethod
+    def _search_text_expr() -> pl.Expr:
+        """Lowercased, space-joined text of the searchable columns."""
+        cols = [
+            MetadataFields.TITLE,
+            MetadataFields.ARTIST,
+            MetadataFields.COVER_ARTIST,
+            MetadataFields.VERSION,
+            MetadataFields.DISC,
+            MetadataFields.TRACK,
+            MetadataFields.DATE,
+            MetadataFields.COMMENT,
+            MetadataFields.SPECIAL,
+            MetadataFields.FILE,
+        ]
+        return pl.concat_str([pl.col(c).fill_null("") for c in cols], separator=" ").str.to_lowercase()
 
     def calculate_statistics(self) -> dict:
         """Calculate statistics using Polars."""
@@ -261,44 +463,35 @@ class FileManager:
                 0,
             )
 
-        df = self.df
-
-        # Filter out empty titles
-        df = df.filter(pl.col(MetadataFields.TITLE).str.strip_chars() != "")
-
-        stats = {}
-        stats["all_songs"] = df.height
-
-        # Unique TA
-        stats["unique_ta"] = df.select([MetadataFields.TITLE, MetadataFields.ARTIST]).n_unique()
-
-        # Unique TAC
-        stats["unique_tac"] = df.select(
-            [MetadataFields.TITLE, MetadataFields.ARTIST, MetadataFields.COVER_ARTIST],
-        ).n_unique()
-
-        # Categories
-        # Neuro
-        neuro_df = df.filter(pl.col(MetadataFields.COVER_ARTIST) == "Neuro")
-        stats["neuro_solos_total"] = neuro_df.height
-        stats["neuro_solos_unique"] = neuro_df.select([MetadataFields.TITLE, MetadataFields.ARTIST]).n_unique()
-
-        # Evil
-        evil_df = df.filter(pl.col(MetadataFields.COVER_ARTIST) == "Evil")
-        stats["evil_solos_total"] = evil_df.height
-        stats["evil_solos_unique"] = evil_df.select([MetadataFields.TITLE, MetadataFields.ARTIST]).n_unique()
-
-        # Duets
-        duets_df = df.filter(pl.col(MetadataFields.COVER_ARTIST) == "Neuro & Evil")
-        stats["duets_total"] = duets_df.height
-        stats["duets_unique"] = duets_df.select([MetadataFields.TITLE, MetadataFields.ARTIST]).n_unique()
+        cover_artist = pl.col(MetadataFields.COVER_ARTIST)
+        title_artist = pl.struct(MetadataFields.TITLE, MetadataFields.ARTIST)
+        categories = {
+            "neuro_solos": cover_artist == "Neuro",
+            "evil_solos": cover_artist == "Evil",
+            "duets": cover_artist == "Neuro & Evil",
+            "other": ~cover_artist.is_in(["Neuro", "Evil", "Neuro & Evil"]),
+        }
 
-        # Other
-        other_df = df.filter(~pl.col(MetadataFields.COVER_ARTIST).is_in(["Neuro", "Evil", "Neuro & Evil"]))
-        stats["other_total"] = other_df.height
-        stats["other_unique"] = other_df.select([MetadataFields.TITLE, MetadataFields.ARTIST]).n_unique()
+        # One select over the filtered frame, so Polars computes every count in a single parallel pass
+        exprs = [
+            pl.len().alias("all_songs"),
+            title_artist.n_unique().alias("unique_ta"),
+            pl.struct(MetadataFields.TITLE, MetadataFields.ARTIST, MetadataFields.COVER_ARTIST)
+            .n_unique()
+            .alias("unique_tac"),
+        ]
+        for name, mask in categories.items():
+            exprs.append(title_artist.filter(mask).n_unique().alias(f"{name}_unique"))
+            exprs.append(mask.sum().alias(f"{name}_total"))
 
-        return stats
+        # Filter out empty titles
+        return (
+            self.df.lazy()
+            .filter(pl.col(MetadataFields.TITLE).str.strip_chars() != "")
+            .select(exprs)
+            .collect()
+            .row(0, named=True)
+        )
 
     @staticmethod
     def prepare_json_for_save(json_text: str) -> tuple[str, dict]:
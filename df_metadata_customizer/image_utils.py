@@ -1,55 +1,82 @@
 """Image cache with optimized resizing for cover images."""
 
 import hashlib
-from collections import deque
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Final
 
 import customtkinter as ctk
 from PIL import Image
 
+# (original image hash, display size) identifying one cached CTKImage
+_ImageKey = tuple[str, tuple[int, int]]
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 class LRUCTKImageCache:
     """Optimized cache for cover images with pre-resized versions."""
 
+    # Target square size for displayed covers
+    DISPLAY_SIZE: Final = (170, 170)
+
     def __init__(self, max_size: int = 100) -> None:
         """Initialize the image cache."""
         self.max_size = max_size
-        self._path_hash_cache: dict[str, str] = {}  # Filepath to image hash
-        self._image_hash_cache: dict[str, str] = {}  # Image hash to resized image hash
-        self._ctkimage_cache: dict[str, ctk.CTkImage] = {}  # Resized hash to resized CTKImage
-        self._access_order: deque[str] = deque()  # LRU with image hashes
+        # Filepath to (file signature, image key), so edits on disk invalidate the entry
+        self._path_hash_cache: dict[str, tuple[tuple[int, int] | None, _ImageKey]] = {}
+        # (original image hash, display size) to CTKImage, in LRU order (least recently used first)
+        self._ctkimage_cache: OrderedDict[_ImageKey, ctk.CTkImage] = OrderedDict()
+        self._lock = threading.Lock()  # Covers are loaded and prefetched from worker threads
 
     def get(self, key: str) -> ctk.CTkImage | None:
         """Get CTKImage from cache."""
-        org_hash = self._path_hash_cache.get(key)
-        if not org_hash:
-            return None
-
-        resized_hash = self._image_hash_cache.get(org_hash)
-        if not resized_hash or resized_hash not in self._ctkimage_cache:
-            return None
-
-        # Update access order
-        if org_hash in self._access_order:
-            self._access_order.remove(org_hash)
-        self._access_order.append(org_hash)
-
-        return self._ctkimage_cache.get(resized_hash)
+        signature = _file_signature(key)
+        with self._lock:
+            entry = self._path_hash_cache.get(key)
+            if not entry:
+                return None
+
+            cached_signature, image_key = entry
+            if cached_signature != signature:
+                # File changed since it was cached
+                del self._path_hash_cache[key]
+                return None
+
+            ctk_img = self._ctkimage_cache.get(image_key)
+            if ctk_img is not None:
+                self._ctkimage_cache.move_to_end(image_key)
+            return ctk_img
 
     def put(self, key: str, image: Image.Image | None, *, resize: bool = True) -> ctk.CTkImage | None:
         """Add image to cache and return CTKImage with LRU eviction."""
         if not image:
             return None
 
-        org_hash = hashlib.sha256(image.tobytes()).hexdigest()
-        self._path_hash_cache[key] = org_hash
+        if resize:
+            # Let the JPEG decoder downscale while decoding (no-op for other formats or loaded images)
+            w, h = self.DISPLAY_SIZE
+            image.draft("RGB", (w * 2, h * 2))
 
-        # Check if already cached
-        res_hash = self._image_hash_cache.get(org_hash)
-        if res_hash and res_hash in self._ctkimage_cache:
-            if org_hash in self._access_order:
-                self._access_order.remove(org_hash)
-            self._access_order.append(org_hash)
-            return self._ctkimage_cache[res_hash]
+        # Decoding, hashing and resizing happen outside the lock, so the Tk thread's get() never waits on them
+        # The displayed image is fully determined by the original pixels and the target size
+        image_key = (hashlib.sha256(image.tobytes()).hexdigest(), self.DISPLAY_SIZE if resize else image.size)
+        path_entry = (_file_signature(key), image_key)
+
+        with self._lock:
+            self._path_hash_cache[key] = path_entry
+            ctk_img = self._ctkimage_cache.get(image_key)
+            if ctk_img is not None:
+                self._ctkimage_cache.move_to_end(image_key)
+                return ctk_img
 
         # Process image
         processed_img = self.optimize_image_for_display(image) if resize else image
@@ -59,40 +86,38 @@ class LRUCTKImageCache:
         if processed_img.mode != "RGB":
             processed_img = processed_img.convert("RGB")
 
-        new_res_hash = hashlib.sha256(processed_img.tobytes()).hexdigest()
         ctk_img = ctk.CTkImage(
             light_image=processed_img,
             size=(processed_img.width, processed_img.height),
         )
 
-        self._image_hash_cache[org_hash] = new_res_hash
-        self._ctkimage_cache[new_res_hash] = ctk_img
-
-        if org_hash in self._access_order:
-            self._access_order.remove(org_hash)
-        self._access_order.append(org_hash)
+        with self._lock:
+            # Another thread may have cached the same image meanwhile; keep the first so callers share it
+            existing = self._ctkimage_cache.get(image_key)
+            if existing is not None:
+                self._ctkimage_cache.move_to_end(image_key)
+                return existing
+            self._ctkimage_cache[image_key] = ctk_img
 
-        # Evict LRU if over size limit
-        while len(self._access_order) > self.max_size:
-            old_org_hash = self._access_order.popleft()
-            old_res_hash = self._image_hash_cache.pop(old_org_hash, None)
-            if old_res_hash:
-                self._ctkimage_cache.pop(old_res_hash, None)
+            # Evict LRU if over size limit
+            while len(self._ctkimage_cache) > self.max_size:
+                self._ctkimage_cache.popitem(last=False)
 
         return ctk_img
 
     def clear(self) -> None:
         """Clear the cache."""
-        self._path_hash_cache.clear()
-        self._image_hash_cache.clear()
-        self._ctkimage_cache.clear()
-        self._access_order.clear()
+        with self._lock:
+            self._path_hash_cache.clear()
+            self._ctkimage_cache.clear()
 
     def update_file_path(self, old_path: str, new_path: str) -> None:
         """Update the file path in the cache (e.g., if a file is renamed)."""
-        if old_path in self._path_hash_cache:
-            image_hash = self._path_hash_cache.pop(old_path)
-            self._path_hash_cache[new_path] = image_hash
+        signature = _file_signature(new_path)
+        with self._lock:
+            if old_path in self._path_hash_cache:
+                _, image_key = self._path_hash_cache.pop(old_path)
+                self._path_hash_cache[new_path] = (signature, image_key)
 
     @staticmethod
     def optimize_image_for_display(img: Image.Image | None) -> Image.Image | None:
@@ -101,7 +126,7 @@ class LRUCTKImageCache:
             return None
 
         # Target square size
-        square_size = (170, 170)  # Can be edited to match your display size
+        square_size = LRUCTKImageCache.DISPLAY_SIZE
 
         # Calculate the maximum size that fits within the square while maintaining aspect ratio
         img_ratio = img.width / img.height
@@ -116,9 +141,11 @@ class LRUCTKImageCache:
             new_width = int(square_size[1] * img_ratio)
 
         # Resize the image to fit within the square container
+        # reducing_gap first shrinks large covers with a cheap box reduce, then finishes with LANCZOS
         resized_img = img.resize(
             (new_width, new_height),
             Image.Resampling.LANCZOS,
+            reducing_gap=2.0,
         )  # TODO: Use NEAREST/HAMMING for future performance mode
 
         # Convert to RGB if necessary
@@ -1,13 +1,20 @@
 """Rule management for metadata customization."""
 
+import operator
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Final
 
 import polars as pl
 
+from df_metadata_customizer.file_manager import FileManager
 from df_metadata_customizer.song_metadata import MetadataFields, SongMetadata
 from df_metadata_customizer.widgets import SortRuleRow
 
+# A rule block specialized for repeated evaluation: (AND-ed conditions, template renderer)
+CompiledRuleBlock = tuple[tuple[Callable[[SongMetadata], bool], ...], Callable[[SongMetadata], str]]
+
 
 class RuleManager:
     """Utility class for managing and applying metadata rules."""
@@ -25,6 +32,25 @@ class RuleManager:
         MetadataFields.UI_FILE: MetadataFields.FILE,
     }
 
+    # Field-value conditions, called as test(actual, value)
+    CONDITION_OPS: Final[dict[str, Callable[[str, str], bool]]] = {
+        "is": operator.eq,
+        "contains": lambda actual, val: val in actual,
+        "starts with": str.startswith,
+        "ends with": str.endswith,
+        "is empty": lambda actual, _val: actual == "",
+        "is not empty": lambda actual, _val: actual != "",
+    }
+
+    # Matches {Field} placeholders in rule templates
+    TEMPLATE_FIELD_RE: Final = re.compile(r"\{([^}]+)\}")
+
+    # Matches key<op>value search tokens; value may be quoted
+    SEARCH_TOKEN_RE: Final = re.compile(
+        rf"(?i)\b({'|'.join(re.escape(k) for k in MetadataFields.get_ui_keys())})"
+        r"\s*(==|!=|>=|<=|>|<|=|~|!~)\s*(?:\"([^\"]+)\"|'([^']+)'|(\S+))",
+    )
+
     @staticmethod
     def parse_search_query(q: str) -> tuple[list[dict[str, str]], list[str]]:
         """Parse search query into structured filters and free-text terms."""
@@ -34,11 +60,7 @@ class RuleManager:
         q_orig = q
         filters = []
 
-        # regex to find key<op>value tokens; value may be quoted
-        fields_pattern = "|".join(re.escape(k) for k in MetadataFields.get_ui_keys())
-        token_re = re.compile(
-            rf"(?i)\b({fields_pattern})\s*(==|!=|>=|<=|>|<|=|~|!~)\s*(?:\"([^\"]+)\"|'([^']+)'|(\S+))",
-        )
+        token_re = RuleManager.SEARCH_TOKEN_RE
 
         # find all matches
         for m in token_re.finditer(q_orig):
@@ -83,8 +105,8 @@ class RuleManager:
 
             # Special handling for version=latest
             if field == MetadataFields.UI_VERSION and val == "_latest_":
-                if "is_latest" in filtered_df.columns:
-                    filtered_df = filtered_df.filter(pl.col("is_latest"))
+                if FileManager.LATEST_COLUMN in filtered_df.columns:
+                    filtered_df = filtered_df.filter(pl.col(FileManager.LATEST_COLUMN))
                 continue
 
             col_expr = pl.col(col_name)
@@ -120,19 +142,21 @@ class RuleManager:
             elif op == "<=":
                 filtered_df = filtered_df.filter(col_expr.str.to_lowercase() <= val.lower())
             elif op in ("=", "~"):  # Contains
-                filtered_df = filtered_df.filter(col_expr.str.to_lowercase().str.contains(re.escape(val.lower())))
+                filtered_df = filtered_df.filter(col_expr.str.to_lowercase().str.contains(val.lower(), literal=True))
             elif op == "==":  # Exact
                 filtered_df = filtered_df.filter(col_expr.str.to_lowercase() == val.lower())
             elif op in ("!=", "!~"):  # Not contains
-                filtered_df = filtered_df.filter(~col_expr.str.to_lowercase().str.contains(re.escape(val.lower())))
+                filtered_df = filtered_df.filter(
+                    ~col_expr.str.to_lowercase().str.contains(val.lower(), literal=True),
+                )
 
         # Free terms
-        if free_terms:
-            search_cols = [pl.col(c) for c in RuleManager.COL_MAP.values() if c in filtered_df.columns]
-            if search_cols:
-                concat_expr = pl.concat_str(search_cols, separator=" ").str.to_lowercase()
-                for term in free_terms:
-                    filtered_df = filtered_df.filter(concat_expr.str.contains(re.escape(term)))
+        # Search text is precomputed per file by FileManager, so this is a plain substring scan
+        if free_terms and FileManager.SEARCH_COLUMN in filtered_df.columns:
+            search_col = pl.col(FileManager.SEARCH_COLUMN)
+            filtered_df = filtered_df.filter(
+                pl.all_horizontal([search_col.str.contains(term, literal=True) for term in free_terms]),
+            )
 
         return filtered_df
 
@@ -161,65 +185,74 @@ class RuleManager:
         return blocks
 
     @staticmethod
-    def eval_rule_block(
-        rule_block: list[dict[str, str]],
+    def apply_rules_list(
+        rules: list[dict[str, str]],
         metadata: SongMetadata,
-    ) -> bool:
-        """Evaluate a block of rules with AND logic (all rules in block must match)."""
-        if not rule_block:
-            return False
-        return all(RuleManager.eval_single_rule(rule, metadata) for rule in rule_block)
+        default: str | None = "",
+    ) -> str | None:
+        """Apply rules list to field values with AND/OR grouping.
+
+        Returns default when no rule block matches with a non-blank result.
+        """
+        return RuleManager.apply_compiled_rules(RuleManager.compile_rules(rules), metadata, default)
 
     @staticmethod
-    def eval_single_rule(rule: dict[str, str], metadata: SongMetadata) -> bool:
-        """Evaluate a single rule."""
+    def compile_condition(rule: dict[str, str]) -> Callable[[SongMetadata], bool]:
+        """Specialize a single rule's condition into a predicate."""
         field = rule.get("if_field", "")
         op = rule.get("if_operator", "")
         val = rule.get("if_value", "")
 
-        actual = metadata.get(field)
-
-        if op == "is":
-            return actual == val
-        if op == "contains":
-            return val in actual
-        if op == "starts with":
-            return actual.startswith(val)
-        if op == "ends with":
-            return actual.endswith(val)
-        if op == "is empty":
-            return actual == ""
-        if op == "is not empty":
-            return actual != ""
         if op == "is latest version":
-            return metadata.is_latest
+            return lambda metadata: metadata.is_latest
         if op == "is not latest version":
-            return not metadata.is_latest
-        return False
+            return lambda metadata: not metadata.is_latest
+
+        test = RuleManager.CONDITION_OPS.get(op)
+        if test is None:
+            return lambda _metadata: False
+        getter = SongMetadata.field_getter(field)
+        return lambda metadata: test(getter(metadata), val)
+
+    @staticmethod
+    def compile_template(template: str) -> Callable[[SongMetadata], str]:
+        """Specialize a template into a renderer, with field lookups resolved."""
+        parts = tuple(
+            SongMetadata.field_getter(part) if is_field else part for part, is_field in _parse_template(template)
+        )
+
+        def render(metadata: SongMetadata) -> str:
+            try:
+                return "".join(part if isinstance(part, str) else part(metadata) for part in parts)
+            except Exception:
+                return ""
+
+        return render
 
     @staticmethod
-    def apply_template(template: str, metadata: SongMetadata) -> str:
-        """Apply template with field values."""
-        if not template:
-            return ""
-        try:
-            return re.sub(r"\{([^}]+)\}", lambda m: metadata.get(m.group(1)), template)
-        except Exception:
-            return ""
+    def compile_rules(rules: list[dict[str, str]]) -> list[CompiledRuleBlock]:
+        """Group rules by AND/OR logic and specialize each block once, for reuse across many songs."""
+        return [
+            (
+                tuple(RuleManager.compile_condition(rule) for rule in block),
+                RuleManager.compile_template(block[-1].get("then_template", "")),
+            )
+            for block in RuleManager.group_rules_by_logic(rules)
+        ]
 
     @staticmethod
-    def apply_rules_list(rules: list[dict[str, str]], metadata: SongMetadata) -> str:
-        """Apply rules list to field values with AND/OR grouping."""
-        if not rules:
-            return ""
-        rule_blocks = RuleManager.group_rules_by_logic(rules)
-        for block in rule_blocks:
-            if RuleManager.eval_rule_block(block, metadata):
-                template = block[-1].get("then_template", "")
-                result = RuleManager.apply_template(template, metadata)
+    def apply_compiled_rules(
+        compiled_rules: list[CompiledRuleBlock],
+        metadata: SongMetadata,
+        default: str | None = "",
+    ) -> str | None:
+        """Apply rules prepared by compile_rules. Returns default when no block yields a non-blank result."""
+        for conditions, render in compiled_rules:
+            if all(condition(metadata) for condition in conditions):
+                result = render(metadata)
                 if result.strip():
                     return result
-        return ""
+        return default
 
     @staticmethod
     def get_sort_rules(sort_rules: list[SortRuleRow]) -> list[dict]:
@@ -233,11 +266,11 @@ class RuleManager:
         if not rules:
             return df
 
-        sort_exprs = []
-        by_cols = []
+        # Sort keys are passed to sort() as expressions, so they are never materialized as columns
+        sort_keys = []
         descending = []
 
-        for i, rule in enumerate(rules):
+        for rule in rules:
             field = rule["field"]
             col_name = RuleManager.COL_MAP.get(field, field)
             if col_name not in df.columns:
@@ -249,38 +282,38 @@ class RuleManager:
             match field:
                 case MetadataFields.UI_TRACK:
                     # Track: split into number and total
-                    cols = [f"_sort_{i}_n", f"_sort_{i}_t"]
-                    sort_exprs.extend(
+                    sort_keys.extend(
                         [
-                            base_col.str.extract(r"^(\d+)", 1).cast(pl.Int64, strict=False).fill_null(0).alias(cols[0]),
-                            base_col.str.extract(r"/(\d+)", 1).cast(pl.Int64, strict=False).fill_null(0).alias(cols[1]),
+                            base_col.str.extract(r"^(\d+)", 1).cast(pl.Int64, strict=False).fill_null(0),
+                            base_col.str.extract(r"/(\d+)", 1).cast(pl.Int64, strict=False).fill_null(0),
                         ],
                     )
-                    by_cols.extend(cols)
                     descending.extend([is_desc, is_desc])
 
                 case MetadataFields.UI_DISC | MetadataFields.UI_SPECIAL:
                     # Integer fields
-                    col = f"_sort_{i}"
-                    sort_exprs.append(base_col.cast(pl.Int64, strict=False).fill_null(0).alias(col))
-                    by_cols.append(col)
+                    sort_keys.append(base_col.cast(pl.Int64, strict=False).fill_null(0))
                     descending.append(is_desc)
 
                 case MetadataFields.UI_VERSION:
                     # Float fields
-                    col = f"_sort_{i}"
-                    sort_exprs.append(base_col.fill_null(0.0).alias(col))
-                    by_cols.append(col)
+                    sort_keys.append(base_col.fill_null(0.0))
                     descending.append(is_desc)
 
                 case _:
                     # String fields (case-insensitive)
-                    col = f"_sort_{i}"
-                    sort_exprs.append(base_col.str.to_lowercase().alias(col))
-                    by_cols.append(col)
+                    sort_keys.append(base_col.str.to_lowercase())
                     descending.append(is_desc)
 
-        if by_cols:
-            return df.with_columns(sort_exprs).sort(by_cols, descending=descending, maintain_order=True).drop(by_cols)
+        if sort_keys:
+            return df.sort(sort_keys, descending=descending, maintain_order=True)
 
         return df
+
+
+@lru_cache(maxsize=256)
+def _parse_template(template: str) -> tuple[tuple[str, bool], ...]:
+    """Split a template into (text, is_field) segments, cached as templates repeat across songs."""
+    # split() alternates literal text and captured field names
+    parts = RuleManager.TEMPLATE_FIELD_RE.split(template)
+    return tuple((part, i % 2 == 1) for i, part in enumerate(parts) if part)
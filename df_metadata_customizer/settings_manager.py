@@ -1,17 +1,69 @@
 """Manages application settings and presets persistence."""
 
+import contextlib
 import json
 import logging
+import os
 import shutil
 import sys
+import tempfile
 from pathlib import Path
 from typing import Any, ClassVar
 
 import customtkinter as ctk
 
+try:
+    import orjson
+except ImportError:  # Optional, faster settings/preset encoding and decoding when installed
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_json(data: object) -> bytes:
+    """Encode data as indented UTF-8 JSON."""
+    if orjson is not None:
+        with contextlib.suppress(orjson.JSONEncodeError):  # e.g. integers wider than 64 bits
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:  # noqa: ANN401
+    """Decode UTF-8 JSON, falling back to the stdlib for what orjson rejects (e.g. NaN written by json.dumps)."""
+    if orjson is not None:
+        with contextlib.suppress(orjson.JSONDecodeError):
+            return orjson.loads(data)
+    # json.loads accepts UTF-8 bytes too, so files are read as bytes either way
+    return json.loads(data)
+
+
+# Process umask, read once at import (setting it is the only way to query it, and is not thread-safe)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data in one call to a temp file, then swap it in so a crash never leaves a truncated file."""
+    # A unique temp name keeps concurrent saves apart; the .tmp suffix keeps it out of list_presets()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files; keep the permissions of the file being replaced,
+        # or give new files the same mode open() would have
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        else:
+            tmp_path.chmod(0o666 & ~_UMASK)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class SettingsManager:
     """Manages application settings and presets persistence."""
 
@@ -26,6 +78,12 @@ class SettingsManager:
     column_widths: ClassVar[dict[str, int]] = {}
     sort_rules: ClassVar[list[dict[str, Any]]] = []
 
+    # Bumped whenever the layout of the metadata cache file changes, so stale caches are ignored
+    METADATA_CACHE_VERSION = 1
+
+    # Parsed presets keyed by name, with the file mtime they were read at
+    _preset_cache: ClassVar[dict[str, tuple[int, dict[str, list[dict[str, Any]]]]]] = {}
+
     @classmethod
     def initialize(cls) -> None:
         """Initialize SettingsManager."""
@@ -62,6 +120,11 @@ class SettingsManager:
         """Get the path to the settings file."""
         return cls.get_base_dir() / f"{cls.APP_NAME}_settings.json"
 
+    @classmethod
+    def get_metadata_cache_path(cls) -> Path:
+        """Get the path to the file caching parsed song metadata between sessions."""
+        return cls.get_base_dir() / f"{cls.APP_NAME}_metadata_cache.json"
+
     @classmethod
     def get_presets_folder(cls) -> Path:
         """Get the presets folder path, creating it if necessary."""
@@ -82,8 +145,7 @@ class SettingsManager:
             "sort_rules": cls.sort_rules,
         }
         try:
-            with cls.get_settings_path().open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_atomic(cls.get_settings_path(), _dumps_json(data))
         except Exception:
             logger.exception("Error saving settings")
 
@@ -93,8 +155,7 @@ class SettingsManager:
         if not cls.get_settings_path().exists():
             return
         try:
-            with cls.get_settings_path().open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _loads_json(cls.get_settings_path().read_bytes())
 
             cls.theme = data.get("theme", "System")
             cls.last_folder_opened = data.get("last_folder_opened")
@@ -107,28 +168,67 @@ class SettingsManager:
         except Exception:
             logger.exception("Error loading settings")
 
+    @classmethod
+    def save_metadata_cache(cls, files: dict[str, list]) -> None:
+        """Save parsed song metadata keyed by path, as returned by FileManager.export_disk_cache."""
+        data = {"version": cls.METADATA_CACHE_VERSION, "files": files}
+        try:
+            # Song JSON may hold NaN or integers wider than 64 bits, which orjson can't write back faithfully
+            _write_atomic(cls.get_metadata_cache_path(), json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        except Exception:
+            logger.exception("Error saving metadata cache")
+
+    @classmethod
+    def load_metadata_cache(cls) -> dict[str, list]:
+        """Load the parsed song metadata saved by save_metadata_cache, or an empty dict."""
+        cache_path = cls.get_metadata_cache_path()
+        if not cache_path.exists():
+            return {}
+        try:
+            data = _loads_json(cache_path.read_bytes())
+        except Exception:
+            logger.exception("Error loading metadata cache")
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != cls.METADATA_CACHE_VERSION:
+            return {}
+        return data.get("files") or {}
+
     @classmethod
     def save_preset(cls, name: str, preset_data: dict[str, list[dict[str, Any]]]) -> None:
         """Save a preset to a JSON file."""
         preset_file = cls.get_presets_folder() / f"{name}.json"
-        with preset_file.open("w", encoding="utf-8") as f:
-            json.dump(preset_data, f, indent=2, ensure_ascii=False)
+        _write_atomic(preset_file, _dumps_json(preset_data))
+        cls._preset_cache[name] = (preset_file.stat().st_mtime_ns, preset_data)
 
     @classmethod
     def load_preset(cls, name: str) -> dict[str, list[dict[str, Any]]]:
-        """Load a preset from a JSON file."""
+        """Load a preset from a JSON file.
+
+        The parsed preset is cached and only re-read when the file's mtime changes, so the
+        returned dict is shared and must not be modified.
+        """
         preset_file = cls.get_presets_folder() / f"{name}.json"
-        if not preset_file.exists():
+        try:
+            mtime = preset_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            cls._preset_cache.pop(name, None)
             msg = f"Preset file '{name}.json' not found"
-            raise FileNotFoundError(msg)
+            raise FileNotFoundError(msg) from None
+
+        cached = cls._preset_cache.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
 
-        with preset_file.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        preset_data = _loads_json(preset_file.read_bytes())
+        cls._preset_cache[name] = (mtime, preset_data)
+        return preset_data
 
     @classmethod
     def delete_preset(cls, name: str) -> None:
         """Delete a preset file."""
         preset_file = cls.get_presets_folder() / f"{name}.json"
+        cls._preset_cache.pop(name, None)
         if preset_file.exists():
             preset_file.unlink()
         else:
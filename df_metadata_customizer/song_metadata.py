@@ -1,6 +1,9 @@
 """Song metadata wrapper providing safe access and defaults."""
 
+from collections.abc import Callable
 from enum import StrEnum
+from operator import attrgetter
+from typing import Final
 
 
 class MetadataFields(StrEnum):
@@ -68,51 +71,31 @@ class SongMetadata:
 
     def get(self, field: str) -> str:
         """Get value from metadata using properties or raw data."""
-        f = field.lower()
-
-        # ID3 overrides
-        if f == MetadataFields.UI_ID3_TITLE:
-            return self._id3_data.get("Title", "")
-        if f == MetadataFields.UI_ID3_ARTIST:
-            return self._id3_data.get("Artist", "")
-        if f == MetadataFields.UI_ID3_ALBUM:
-            return self._id3_data.get("Album", "")
-        if f == MetadataFields.UI_ID3_TRACK:
-            return self._id3_data.get("Track", "")
-        if f == MetadataFields.UI_ID3_DISC:
-            # Check both key variants just in case
-            return self._id3_data.get("Discnumber") or self._id3_data.get("Disc", "")
-        if f == MetadataFields.UI_ID3_DATE:
-            return self._id3_data.get("Date", "")
-
-        # JSON / Standard access
-        if f == MetadataFields.UI_TITLE:
-            return self.title
-        if f == MetadataFields.UI_ARTIST:
-            return self.artist
-        if f == MetadataFields.UI_COVER_ARTIST:
-            return self.coverartist
-        if f == MetadataFields.UI_VERSION:
-            return self.version_str
-        if f in (MetadataFields.UI_DISC, MetadataFields.DISC.lower()):
-            return self.disc
-        if f == MetadataFields.UI_TRACK:
-            return self.track
-        if f == MetadataFields.UI_DATE:
-            return self.date
-        if f == MetadataFields.UI_COMMENT:
-            return self.comment
-        if f == MetadataFields.UI_SPECIAL:
-            return self.special
+        getter = _FIELD_GETTERS.get(field.lower())
+        if getter is not None:
+            return getter(self)
 
         val = self._data.get(field)
         return str(val) if val is not None else ""
 
+    @staticmethod
+    def field_getter(field: str) -> Callable[["SongMetadata"], str]:
+        """Resolve a field name once into an accessor equivalent to get(field), for repeated lookups."""
+        getter = _FIELD_GETTERS.get(field.lower())
+        if getter is not None:
+            return getter
+        return lambda metadata: metadata.get(field)
+
     @property
     def raw_data(self) -> dict:
         """Return the raw metadata dictionary."""
         return self._data
 
+    @property
+    def id3_data(self) -> dict[str, str]:
+        """Return the standard ID3 tags read from the file."""
+        return self._id3_data
+
     @property
     def title(self) -> str:
         """Return the song title."""
@@ -163,3 +146,27 @@ class SongMetadata:
     def is_latest(self) -> bool:
         """Return whether this is the latest version."""
         return self._is_latest
+
+
+# Lowercased field name -> accessor, so SongMetadata.get is a single dict lookup per rule/template field
+_FIELD_GETTERS: Final[dict[str, Callable[[SongMetadata], str]]] = {
+    # ID3 overrides
+    MetadataFields.UI_ID3_TITLE: lambda m: m.id3_data.get("Title", ""),
+    MetadataFields.UI_ID3_ARTIST: lambda m: m.id3_data.get("Artist", ""),
+    MetadataFields.UI_ID3_ALBUM: lambda m: m.id3_data.get("Album", ""),
+    MetadataFields.UI_ID3_TRACK: lambda m: m.id3_data.get("Track", ""),
+    # Check both key variants just in case
+    MetadataFields.UI_ID3_DISC: lambda m: m.id3_data.get("Discnumber") or m.id3_data.get("Disc", ""),
+    MetadataFields.UI_ID3_DATE: lambda m: m.id3_data.get("Date", ""),
+    # JSON / Standard access
+    MetadataFields.UI_TITLE: attrgetter("title"),
+    MetadataFields.UI_ARTIST: attrgetter("artist"),
+    MetadataFields.UI_COVER_ARTIST: attrgetter("coverartist"),
+    MetadataFields.UI_VERSION: attrgetter("version_str"),
+    MetadataFields.UI_DISC: attrgetter("disc"),
+    MetadataFields.DISC.lower(): attrgetter("disc"),
+    MetadataFields.UI_TRACK: attrgetter("track"),
+    MetadataFields.UI_DATE: attrgetter("date"),
+    MetadataFields.UI_COMMENT: attrgetter("comment"),
+    MetadataFields.UI_SPECIAL: attrgetter("special"),
+}
@@ -8,53 +8,97 @@ import os
 import platform
 import shutil
 import subprocess
+from collections.abc import Iterator
 from io import BytesIO
 from pathlib import Path
 from tkinter import messagebox
+from typing import BinaryIO, Final
 
-from mutagen.id3 import APIC, COMM, ID3, TALB, TDRC, TIT2, TPE1, TPOS, TRCK, ID3NoHeaderError
+from mutagen import PaddingInfo
+from mutagen.id3 import APIC, COMM, ID3, TALB, TDRC, TIT2, TPE1, TPOS, TRCK, ID3NoHeaderError, TextFrame
 from PIL import Image
 from tinytag import TinyTag
 
+try:
+    import orjson
+except ImportError:  # Optional, faster JSON decoding when installed
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 SUPPORTED_FILES_TYPES = {".mp3"}  # set(TinyTag.SUPPORTED_FILE_EXTENSIONS)
+ID3_ENCODING_UTF8: Final = 3
 
+# write_id3_tags argument name -> standard text frame
+_ID3_FRAMES: Final[dict[str, type[TextFrame]]] = {
+    "title": TIT2,
+    "artist": TPE1,
+    "album": TALB,
+    "date": TDRC,
+    "track": TRCK,
+    "disc": TPOS,
+}
 
-def extract_json_from_song(path: str) -> dict | None:
-    """Return parsed JSON dict or None."""
-    try:
-        tags = TinyTag.get(path, tags=True, image=False)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle both the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
 
-        # tag.comment and tag.other['comment'] may contain JSON texts
-        texts = tags.other.get("comment") or []  # All entries in other are lists
-        if tags.comment:
-            texts.append(tags.comment)
+# Parses the object at a given offset and stops at its end, so JSON embedded in other text needs no slicing
+_JSON_DECODER: Final = json.JSONDecoder()
 
-        if not texts:
-            return None
 
-        # Combine jsons
-        comm_data = {}
-        for text in texts:
-            with contextlib.suppress(json.JSONDecodeError, TypeError):
-                comm_data.update(json.loads(text))
+def iter_song_files(root: str) -> Iterator[str]:
+    """Yield paths of supported song files below root (recursive, symlinked dirs not followed).
 
-    except Exception:
-        logger.exception("Error parsing JSON from file comment")
+    Uses os.scandir so file type checks come from the directory listing instead of extra stat calls.
+    """
+    suffixes = tuple(SUPPORTED_FILES_TYPES)
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                        yield entry.path
+        except OSError:
+            logger.warning("Skipping unreadable directory", exc_info=True)
+
+
+def _json_from_tags(tags: TinyTag) -> dict | None:
+    """Return the JSON dict combined from all comment texts of parsed tags, or None."""
+    # tag.comment and tag.other['comment'] may contain JSON texts
+    texts = list(tags.other.get("comment") or [])  # All entries in other are lists
+    if tags.comment:
+        texts.append(tags.comment)
+
+    if not texts:
         return None
 
-    return comm_data
+    # Combine jsons
+    comm_data = {}
+    for text in texts:
+        # Cheap pre-filter: most comments are not JSON at all
+        if "{" not in text:
+            continue
 
+        # Fast path: the whole comment is the JSON object, parsed by the C decoder without scanning
+        stripped = text.strip()
+        if stripped.startswith("{") and stripped.endswith("}"):
+            try:
+                comm_data.update(_json_loads(stripped))
+                continue
+            except json.JSONDecodeError:
+                pass
+
+        # JSON surrounded by other text: decode the first object in place with the C scanner
+        with contextlib.suppress(json.JSONDecodeError, TypeError):
+            comm_data.update(_JSON_DECODER.raw_decode(text, text.index("{"))[0])
+    return comm_data
 
-def get_id3_tags(path: str) -> dict[str, str]:
-    """Return dictionary of standard ID3 tags."""
-    try:
-        tags = TinyTag.get(path, tags=True, image=False)
-    except Exception:
-        logger.exception("Error reading ID3 tags")
-        return {}
 
+def _id3_from_tags(tags: TinyTag) -> dict[str, str]:
+    """Return dictionary of standard ID3 tags from parsed tags."""
     return {
         "Title": tags.title or "",
         "Artist": tags.artist or "",
@@ -65,47 +109,145 @@ def get_id3_tags(path: str) -> dict[str, str]:
     }
 
 
-def write_json_to_song(path: str, json_data: dict | str) -> bool:
-    """Write JSON data back to song comment tag."""
+def _parse_song_tags(path: str) -> tuple[dict | None, dict[str, str]]:
+    tags = TinyTag.get(path, tags=True, duration=False, image=False)
+    return _json_from_tags(tags), _id3_from_tags(tags)
+
+
+def read_song_tags(path: str) -> tuple[dict | None, dict[str, str]]:
+    """Return (embedded JSON dict or None, standard ID3 tags) from a single parse of the file."""
     try:
-        # Try to load existing tags or create new ones
+        return _parse_song_tags(path)
+    except Exception:
+        logger.exception("Error reading song tags")
+        return None, {}
+
+
+# path -> ((mtime_ns, size), read_song_tags result); one entry per file, replaced when the file changes
+_song_tags_cache: dict[str, tuple[tuple[int, int], tuple[dict | None, dict[str, str]]]] = {}
+
+
+def read_song_tags_cached(path: str, mtime_ns: int, size: int) -> tuple[dict | None, dict[str, str]]:
+    """Memoized read_song_tags, keyed on the file's mtime and size so edits on disk invalidate it.
+
+    The returned dicts are shared between callers and must not be mutated.
+    """
+    stamp = (mtime_ns, size)
+    cached = _song_tags_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    result = read_song_tags(path)
+    _song_tags_cache[path] = (stamp, result)
+    return result
+
+
+def extract_json_from_song(path: str) -> dict | None:
+    """Return parsed JSON dict or None."""
+    return read_song_tags(path)[0]
+
+
+def read_songs_tags(paths: list[str]) -> list[tuple[tuple[int, int] | None, tuple[dict | None, dict[str, str]]]]:
+    """Return (stamp, read_song_tags result) for each path; lets a worker process take many files per task.
+
+    The stamp is the file's (mtime_ns, size) taken before parsing, so the results can seed
+    read_song_tags_cached with cache_song_tags. It is None if the file could not be read or parsed.
+    """
+    results = []
+    for path in paths:
         try:
-            tags = ID3(path)
+            st = Path(path).stat()
+            results.append(((st.st_mtime_ns, st.st_size), _parse_song_tags(path)))
+        except Exception:
+            logger.exception("Error reading song tags")
+            results.append((None, (None, {})))
+    return results
+
+
+def cache_song_tags(path: str, stamp: tuple[int, int], result: tuple[dict | None, dict[str, str]]) -> None:
+    """Store a read_song_tags result parsed elsewhere (e.g. in a worker process) for read_song_tags_cached."""
+    _song_tags_cache[path] = (stamp, result)
+
+
+def _keep_padding(info: PaddingInfo) -> int:
+    """Return the padding for ID3 saves: keep whatever is left, so edits that fit are written in place.
+
+    Mutagen's default shrinks "too large" padding, which rewrites the whole file. Here the tag region only
+    ever grows (with at least 1 KiB of headroom) when new data no longer fits, at the cost of slightly
+    larger files.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return max(1024, info.get_default_padding())
+
+
+@contextlib.contextmanager
+def _edit_id3(path: str) -> Iterator[tuple[ID3, BinaryIO]]:
+    """Open a file once for both loading and saving its ID3 tag (an empty tag if it has none)."""
+    with Path(path).open("rb+") as f:
+        # Tag rewrites stream through the file once; hint readahead accordingly where supported
+        _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+        try:
+            tags = ID3(f)
         except ID3NoHeaderError:
             tags = ID3()
+        # Loading leaves the handle past the tag; ID3.save reads the old header from the current position
+        f.seek(0)
+        yield tags, f
+
+        # Batch applies touch each file once, so don't let them fill the page cache
+        f.flush()
+        _fadvise(f, "POSIX_FADV_DONTNEED")
 
-        # Remove existing COMM frames
-        tags.delall("COMM::ved")
-
-        # Convert JSON to string and create new COMM frame
-        # FIXED: Don't double-encode the JSON, just use the string directly
-        json_str = json_data if isinstance(json_data, str) else json.dumps(json_data, ensure_ascii=False)
-
-        # FIXED: Create COMM frame with proper encoding and description
-        tags.add(
-            COMM(
-                encoding=3,  # UTF-8
-                lang="ved",  # Use 'ved' for custom archive
-                desc="",  # Empty description
-                text=json_str,
-            ),
-        )
-
-        # Save the tags
-        tags.save(path)
+
+def _fadvise(f: BinaryIO, advice: str) -> None:
+    """Give the kernel an access pattern hint for the whole file (no-op where posix_fadvise is unavailable)."""
+    if hasattr(os, "posix_fadvise"):
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+
+
+def _set_json_comment(tags: ID3, json_data: dict | str) -> None:
+    """Replace the archive COMM frame holding the song's JSON."""
+    # Remove existing COMM frames
+    tags.delall("COMM::ved")
+
+    # Convert JSON to string and create new COMM frame
+    # FIXED: Don't double-encode the JSON, just use the string directly
+    json_str = json_data if isinstance(json_data, str) else json.dumps(json_data, ensure_ascii=False)
+
+    # FIXED: Create COMM frame with proper encoding and description
+    tags.add(
+        COMM(
+            encoding=ID3_ENCODING_UTF8,
+            lang="ved",  # Use 'ved' for custom archive
+            desc="",  # Empty description
+            text=json_str,
+        ),
+    )
+
+
+def write_json_to_song(path: str, json_data: dict | str) -> bool:
+    """Write JSON data back to song comment tag."""
+    try:
+        with _edit_id3(path) as (tags, f):
+            _set_json_comment(tags, json_data)
+
+            # Save the tags through the same handle
+            tags.save(f, padding=_keep_padding)
     except Exception:
         logger.exception("Error writing JSON to song")
         return False
     return True
 
 
-def read_cover_from_song(path: str) -> Image.Image | None:
-    """Return (PIL Image, mime) or (None, None)."""
+def read_cover_bytes_from_song(path: str) -> tuple[bytes, str] | None:
+    """Return the embedded cover's original (bytes, mime type) without decoding it, or None."""
     try:
-        tags = TinyTag.get(path, tags=True, image=True)
+        tags = TinyTag.get(path, tags=True, duration=False, image=True)
         img = tags.images.any
         if img:
-            return Image.open(BytesIO(img.data))
+            return img.data, img.mime_type or "image/jpeg"
 
     except Exception:
         logger.exception("Error reading cover image")
@@ -113,6 +255,31 @@ def read_cover_from_song(path: str) -> Image.Image | None:
     return None
 
 
+def read_cover_from_song(path: str) -> Image.Image | None:
+    """Return the embedded cover as a lazily decoded PIL Image, or None."""
+    cover = read_cover_bytes_from_song(path)
+    if not cover:
+        return None
+
+    try:
+        return Image.open(BytesIO(cover[0]))
+    except Exception:
+        logger.exception("Error reading cover image")
+        return None
+
+
+def _set_text_frame(tags: ID3, frame_cls: type[TextFrame], value: str) -> bool:
+    """Replace a text frame unless it already holds exactly value. Returns True if the tags changed."""
+    frame_id = frame_cls.__name__
+    existing = tags.getall(frame_id)
+    if len(existing) == 1 and [str(t) for t in existing[0].text] == [value]:
+        return False
+
+    tags.delall(frame_id)
+    tags.add(frame_cls(encoding=ID3_ENCODING_UTF8, text=value))
+    return True
+
+
 def write_id3_tags(
     path: str,
     title: str | None = None,
@@ -124,40 +291,59 @@ def write_id3_tags(
     cover_bytes: bytes | None = None,
     cover_mime: str = "image/jpeg",
 ) -> bool:
-    """Write provided tags to file (only provided ones). Returns True/False."""
+    """Write provided tags to file (only provided ones). Returns True/False.
+
+    The file is only rewritten if at least one frame actually changed.
+    """
     try:
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-        if title is not None:
-            tags.delall("TIT2")
-            tags.add(TIT2(encoding=3, text=title))
-        if artist is not None:
-            tags.delall("TPE1")
-            tags.add(TPE1(encoding=3, text=artist))
-        if album is not None:
-            tags.delall("TALB")
-            tags.add(TALB(encoding=3, text=album))
-        if date is not None:
-            tags.delall("TDRC")
-            tags.add(TDRC(encoding=3, text=str(date)))
-        if track is not None:
-            tags.delall("TRCK")
-            tags.add(TRCK(encoding=3, text=str(track)))
-        if disc is not None:
-            tags.delall("TPOS")
-            tags.add(TPOS(encoding=3, text=str(disc)))
-        if cover_bytes:
-            tags.delall("APIC")
-            tags.add(APIC(encoding=3, mime=cover_mime, type=3, desc="Cover", data=cover_bytes))
-        tags.save(path)
+        # Load and save through one handle so the file is only opened once
+        with _edit_id3(path) as (tags, f):
+            frames = {"title": title, "artist": artist, "album": album, "track": track, "disc": disc, "date": date}
+            if _set_id3_frames(tags, frames, cover_bytes, cover_mime):
+                tags.save(f, padding=_keep_padding)
     except Exception:
         logger.exception("Error writing tags")
         return False
     return True
 
 
+def _set_id3_frames(
+    tags: ID3,
+    frames: dict[str, str | None],
+    cover_bytes: bytes | None,
+    cover_mime: str,
+) -> bool:
+    """Set the provided standard frames (None values are left untouched) and cover. Returns True if anything changed."""
+    changed = False
+    for name, value in frames.items():
+        if value is not None:
+            changed |= _set_text_frame(tags, _ID3_FRAMES[name], str(value))
+    if cover_bytes:
+        tags.delall("APIC")
+        tags.add(APIC(encoding=ID3_ENCODING_UTF8, mime=cover_mime, type=3, desc="Cover", data=cover_bytes))
+        changed = True
+    return changed
+
+
+def write_song_metadata(
+    path: str,
+    json_data: dict | str,
+    id3_frames: dict[str, str | None],
+    cover_bytes: bytes | None = None,
+    cover_mime: str = "image/jpeg",
+) -> bool:
+    """Write the JSON comment, standard tags (keyed like write_id3_tags' arguments) and cover in one load and save."""
+    try:
+        with _edit_id3(path) as (tags, f):
+            _set_json_comment(tags, json_data)
+            _set_id3_frames(tags, id3_frames, cover_bytes, cover_mime)
+            tags.save(f, padding=_keep_padding)
+    except Exception:
+        logger.exception("Error writing song metadata")
+        return False
+    return True
+
+
 def play_song(file_path: str) -> bool:
     """Play a song using the system's default audio player."""
     if platform.system() == "Windows":
@@ -214,6 +400,10 @@ After installation, try double-clicking again."""
     messagebox.showinfo("Media Player Required", instructions)
 
 
+# Bytes read per call when hashing audio; large enough that reads and hashing run mostly without the GIL
+_HASH_CHUNK_SIZE: Final = 1 << 20
+
+
 def get_audio_hash(path: str) -> str | None:
     """Calculate SHA256 hash of the audio content, ignoring ID3v1/v2 tags.
 
@@ -278,14 +468,14 @@ def get_audio_hash(path: str) -> str | None:
                 f.seek(0)
                 bytes_to_read = file_size
 
-            # Read in chunks
-            chunk_size = 65536
+            # Read in chunks into one reused buffer, so no bytes object is allocated per chunk
+            buf = memoryview(bytearray(_HASH_CHUNK_SIZE))
             while bytes_to_read > 0:
-                chunk = f.read(min(chunk_size, bytes_to_read))
-                if not chunk:
+                n = f.readinto(buf[: min(_HASH_CHUNK_SIZE, bytes_to_read)])
+                if not n:
                     break
-                sha256.update(chunk)
-                bytes_to_read -= len(chunk)
+                sha256.update(buf[:n])
+                bytes_to_read -= n
 
         return sha256.hexdigest()
     except Exception:
@@ -92,6 +92,7 @@ class RuleRow(ctk.CTkFrame):
         self.delete_callback = delete_callback
         self.move_callback = move_callback
         self.is_first = is_first
+        self.operators = operators
 
         # layout
         self.grid_columnconfigure(0, weight=0)  # AND/OR label
@@ -176,6 +177,14 @@ class RuleRow(ctk.CTkFrame):
         self.up_btn.configure(state="disabled" if is_top else "normal")
         self.down_btn.configure(state="disabled" if is_bottom else "normal")
 
+    def reset(self) -> None:
+        """Restore the default rule values, so a detached row can be reused for a new rule."""
+        self.logic_var.set("AND")
+        self.field_var.set(MetadataFields.get_json_keys()[0])
+        self.op_var.set(self.operators[0])
+        self.value_entry.delete(0, "end")
+        self.template_entry.delete(0, "end")
+
     def get_rule(self) -> dict[str, str]:
         """Return the rule configuration as a dictionary."""
         return {
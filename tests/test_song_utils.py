@@ -0,0 +1,55 @@
+"""Tests for ID3 tag writing in song_utils."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from mutagen.id3 import ID3, TIT2
+
+from df_metadata_customizer import song_utils
+
+# One silent MPEG-1 Layer III frame, repeated to stand in for the audio after the tag
+_AUDIO_FRAME = b"\xff\xfb\x90\x64" + bytes(413)
+_AUDIO = _AUDIO_FRAME * 20
+
+
+class WriteTagsTest(unittest.TestCase):
+    """Saving tags in place must not move or duplicate the audio data."""
+
+    def setUp(self) -> None:
+        """Create a tagged MP3 in a temporary folder."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "song.mp3"
+        self.path.write_bytes(_AUDIO)
+        tags = ID3()
+        tags.add(TIT2(encoding=3, text="Original"))
+        tags.save(self.path)
+
+    def layout(self) -> tuple[int, int]:
+        """Return (file size, offset of the audio data)."""
+        data = self.path.read_bytes()
+        return len(data), data.find(_AUDIO)
+
+    def test_repeated_writes_keep_file_layout(self) -> None:
+        """Writing twice leaves the file size and audio offset as the first write left them."""
+        self.assertTrue(song_utils.write_id3_tags(str(self.path), title="First"))
+        after_first = self.layout()
+        self.assertTrue(song_utils.write_json_to_song(str(self.path), {"Title": "First"}))
+        self.assertTrue(song_utils.write_id3_tags(str(self.path), title="Second"))
+
+        self.assertEqual(self.layout(), after_first)
+        self.assertEqual(self.path.read_bytes().count(b"ID3"), 1)
+        self.assertEqual(str(ID3(self.path)["TIT2"]), "Second")
+
+    def test_edit_within_padding_is_in_place(self) -> None:
+        """An edit that fits the existing padding reuses it instead of rewriting the file."""
+        before = self.layout()
+        self.assertTrue(song_utils.write_id3_tags(str(self.path), title="Edited", artist="Someone"))
+
+        self.assertEqual(self.layout(), before)
+        self.assertEqual(str(ID3(self.path)["TPE1"]), "Someone")
+
+
+if __name__ == "__main__":
+    unittest.main()